@@ -27,12 +27,50 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Tuple, Optional, Any, Callable, FrozenSet
 from abc import ABC, abstractmethod
-from collections import deque
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, cycle, islice
+from operator import attrgetter
+import functools
 import hashlib
 import json
 import numpy as np
+import os
 import time
 import re
+import threading
+import zlib
+
+# Optional: JIT-compiles numeric kernels. Opt in with TRIPARTITE_AGI_NUMBA=1;
+# compiling costs more than short runs such as the tests and demo gain back
+numba = None
+if os.environ.get('TRIPARTITE_AGI_NUMBA') == '1':
+    try:
+        import numba
+    except ImportError:
+        numba = None
+
+_prange = numba.prange if numba is not None else range
+
+
+def _jit(**options):
+    """numba.njit(**options) when Numba is enabled, else leave the function as is.
+    
+    Callers check `numba is not None` to choose between a compiled kernel and
+    their NumPy path, so the undecorated Python kernels are not run in practice.
+    """
+    if numba is None:
+        return lambda fn: fn
+    return numba.njit(**options)
+
+try:
+    import orjson  # Optional: faster parsing of LLM COMMANDS blocks
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # ============================================================================
@@ -105,9 +143,14 @@ class AspectType(Enum):
     PRAGMATIST = "pragmatist"
 
 
+# json.dumps builds a new encoder whenever options are passed; integrity checks
+# rerun on every status query, so the checksum encoder is made once
+_checksum_encode = json.JSONEncoder(sort_keys=True, default=str).encode
+
+
 def compute_checksum(data: Any) -> str:
     """Compute SHA-256 checksum for integrity verification."""
-    content = json.dumps(data, sort_keys=True, default=str)
+    content = _checksum_encode(data)
     return hashlib.sha256(content.encode()).hexdigest()
 
 
@@ -124,15 +167,43 @@ class SensorReading:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(init=False)
 class DetectedEntity:
-    """An entity detected in the environment."""
+    """An entity detected in the environment.
+    
+    One is built per entity in every sensor update, so it uses __slots__.
+    Slotted fields cannot have class-level defaults, hence the explicit __init__.
+    """
+    __slots__ = ('entity_id', 'entity_type', 'description', 'position', 'state',
+                 'confidence', '_description_lower')
     entity_id: str
     entity_type: EntityType
     description: str
-    position: Optional[Tuple[float, float, float]] = None
-    state: Dict[str, Any] = field(default_factory=dict)
-    confidence: float = 1.0
+    position: Optional[Tuple[float, float, float]]
+    state: Dict[str, Any]
+    confidence: float
+    
+    def __init__(self, entity_id: str, entity_type: EntityType, description: str,
+                 position: Optional[Tuple[float, float, float]] = None,
+                 state: Optional[Dict[str, Any]] = None,
+                 confidence: float = 1.0):
+        self.entity_id = entity_id
+        self.entity_type = entity_type
+        self.description = description
+        self.position = position
+        self.state = {} if state is None else state
+        self.confidence = confidence
+        # (description, description.lower()), filled in by description_lower
+        self._description_lower: Optional[Tuple[str, str]] = None
+    
+    @property
+    def description_lower(self) -> str:
+        """Lowercased description, cached until the description changes."""
+        cached = self._description_lower
+        if cached is None or cached[0] is not self.description:
+            cached = (self.description, self.description.lower())
+            self._description_lower = cached
+        return cached[1]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -183,26 +254,35 @@ class EmotionalValue:
     urgency: float
     secondary_emotions: List[Tuple[EmotionCategory, float]] = field(default_factory=list)
     
+    # Per-emotion deltas, scaled by intensity
+    MODULATIONS = {
+        EmotionCategory.FEAR: {'risk_tolerance': -0.3, 'caution_level': 0.4},
+        EmotionCategory.ANXIETY: {'risk_tolerance': -0.2, 'caution_level': 0.2},
+        EmotionCategory.CURIOSITY: {'exploration_drive': 0.4, 'risk_tolerance': 0.1},
+        EmotionCategory.CONCERN: {'social_priority': 0.4},
+        EmotionCategory.URGENCY: {'time_pressure': 0.3},
+        EmotionCategory.CAUTION: {'risk_tolerance': -0.2, 'caution_level': 0.3},
+    }
+    
     def get_modulation_factors(self) -> Dict[str, float]:
+        # Callers mutate the result, so hand out a fresh dict from the cached base
+        return dict(self._base_modulation_factors(self.primary_emotion, self.intensity, self.urgency))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _base_modulation_factors(primary_emotion: EmotionCategory, intensity: float,
+                                 urgency: float) -> Tuple[Tuple[str, float], ...]:
         factors = {
             'risk_tolerance': 0.5,
             'exploration_drive': 0.5,
             'social_priority': 0.5,
-            'time_pressure': self.urgency,
+            'time_pressure': urgency,
             'caution_level': 0.5,
         }
-        modulations = {
-            EmotionCategory.FEAR: {'risk_tolerance': -0.3, 'caution_level': 0.4},
-            EmotionCategory.ANXIETY: {'risk_tolerance': -0.2, 'caution_level': 0.2},
-            EmotionCategory.CURIOSITY: {'exploration_drive': 0.4, 'risk_tolerance': 0.1},
-            EmotionCategory.CONCERN: {'social_priority': 0.4},
-            EmotionCategory.URGENCY: {'time_pressure': 0.3},
-            EmotionCategory.CAUTION: {'risk_tolerance': -0.2, 'caution_level': 0.3},
-        }
-        if self.primary_emotion in modulations:
-            for key, delta in modulations[self.primary_emotion].items():
-                factors[key] = np.clip(factors[key] + delta * self.intensity, 0.0, 1.0)
-        return factors
+        if primary_emotion in EmotionalValue.MODULATIONS:
+            for key, delta in EmotionalValue.MODULATIONS[primary_emotion].items():
+                factors[key] = np.clip(factors[key] + delta * intensity, 0.0, 1.0)
+        return tuple(factors.items())
 
 
 @dataclass
@@ -217,27 +297,95 @@ class ProposedAction:
     predicted_effects: List[Dict[str, Any]]
     llm_response: Optional[str] = None
     vote_components: Optional[Dict[str, Any]] = None  # Breakdown of vote calculation
+    # zlib-compressed llm_response, for layers built with compress_llm_responses=True
+    llm_response_compressed: Optional[bytes] = field(default=None, repr=False)
+    _text_lower: Optional[Tuple[str, str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def get_llm_response(self) -> Optional[str]:
+        """Raw LLM text behind this proposal, whether or not it was compressed."""
+        if self.llm_response_compressed is None:
+            return self.llm_response
+        return zlib.decompress(self.llm_response_compressed).decode('utf-8')
+    
+    def _lowered(self) -> Tuple[str, str, str, str]:
+        cached = self._text_lower
+        if (cached is None or cached[0] is not self.action_description
+                or cached[1] is not self.rationale):
+            cached = (self.action_description, self.rationale,
+                      self.action_description.lower(), self.rationale.lower())
+            self._text_lower = cached
+        return cached
+    
+    @property
+    def description_lower(self) -> str:
+        """Lowercased action description, cached until it changes."""
+        return self._lowered()[2]
+    
+    @property
+    def rationale_lower(self) -> str:
+        """Lowercased rationale, cached until it changes."""
+        return self._lowered()[3]
 
 
 @dataclass
 class IncidentRecord:
-    """Record of a past incident stored in Incident History."""
+    """Record of a past incident stored in Incident History.
+    
+    Up to history_size of these are held at once, so it uses __slots__.
+    """
+    __slots__ = ('timestamp', 'impetus', 'emotional_value', 'proposed_actions',
+                 'selected_action', 'outcome', '_features')
     timestamp: float
     impetus: Impetus
     emotional_value: EmotionalValue
     proposed_actions: List[ProposedAction]
     selected_action: Optional[ProposedAction]
     outcome: Optional[Dict[str, Any]]
+    
+    def __post_init__(self):
+        # Similarity features, filled in by SubconsciousLayer on first use:
+        # (trigger_type, drive_mask, severity, entity_type_mask, primary_emotion)
+        self._features = None
+    
+    @property
+    def quality(self) -> Optional[float]:
+        """The outcome's quality (0.5 if unstated), or None while there is no outcome."""
+        outcome = self.outcome
+        return outcome.get('quality', 0.5) if outcome else None
 
 
 @dataclass
 class DeliberationPackage:
     """Complete package sent to Conscious Layer for deliberation."""
+    __slots__ = ('impetus', 'emotional_value', 'relevant_history', 'modulation_factors',
+                 '_drives_text', '_entities_brief_text')
     impetus: Impetus
     emotional_value: EmotionalValue
     relevant_history: List[IncidentRecord]
     modulation_factors: Dict[str, float]
     
+    def __post_init__(self):
+        # Prompt fragments, computed on first use (__slots__ rules out cached_property)
+        self._drives_text = None
+        self._entities_brief_text = None
+    
+    @property
+    def drives_text(self) -> str:
+        """Comma-separated names of the involved Core Drives."""
+        if self._drives_text is None:
+            self._drives_text = ', '.join(d.name for d in self.impetus.involved_drives)
+        return self._drives_text
+    
+    @property
+    def entities_brief_text(self) -> str:
+        """One-line summary of the first three entities, or "None"."""
+        if self._entities_brief_text is None:
+            entities_brief = [f"{e.entity_id}({e.entity_type.value}): {e.description[:50]}"
+                              for e in self.impetus.relevant_entities[:3]]
+            self._entities_brief_text = "; ".join(entities_brief) if entities_brief else "None"
+        return self._entities_brief_text
+    
     def to_prompt_context(self) -> str:
         entities_json = json.dumps([e.to_dict() for e in self.impetus.relevant_entities], indent=2)
         return f"""CURRENT SITUATION:
@@ -250,7 +398,22 @@ EMOTIONAL ASSESSMENT:
 - Primary emotion: {self.emotional_value.primary_emotion.value} (intensity: {self.emotional_value.intensity:.2f})
 - Urgency: {self.emotional_value.urgency:.2f}
 
-CORE DRIVES INVOLVED: {', '.join(d.name for d in self.impetus.involved_drives)}"""
+CORE DRIVES INVOLVED: {self.drives_text}"""
+
+
+@dataclass
+class HarmContribution:
+    """Harm found for a single command or entity during veto assessment.
+    
+    Allocated once per command/entity on the veto hot path, so it uses
+    __slots__ rather than a nested dict.
+    """
+    __slots__ = ('dimensions', 'analysis')
+    dimensions: Dict[str, float]  # HarmDimension.value -> harm score
+    analysis: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'dimensions': self.dimensions, 'analysis': self.analysis}
 
 
 @dataclass
@@ -264,11 +427,31 @@ class VetoDecision:
 
 
 class LLMClient(ABC):
-    """Abstract interface for LLM API calls."""
+    """Abstract interface for LLM API calls.
+    
+    Unless SUPPORTS_BATCH is set, the Conscious Layer calls query() from one
+    thread per Aspect at once, so implementations must be thread-safe: guard
+    any shared state (call counters, sessions, caches) with a lock.
+    """
+    
+    # True when query_batch answers all prompts in one backend request;
+    # otherwise the Conscious Layer issues per-Aspect queries concurrently
+    SUPPORTS_BATCH = False
+    
     @abstractmethod
     def query(self, prompt: str, system_prompt: Optional[str] = None,
               max_tokens: int = 256) -> str:
         pass
+    
+    def query_batch(self, requests: List[Tuple[str, Optional[str]]],
+                    max_tokens: int = 256) -> List[str]:
+        """Answer (prompt, system_prompt) pairs, responses in request order.
+        
+        Backends with a batch endpoint (vLLM, TGI, ...) override this and
+        set SUPPORTS_BATCH; the default issues the queries one at a time.
+        """
+        return [self.query(prompt, system_prompt, max_tokens=max_tokens)
+                for prompt, system_prompt in requests]
 
 
 # ============================================================================
@@ -291,6 +474,7 @@ class AnthropicLLMClient(LLMClient):
     def __init__(self, model: str = "claude-sonnet-4-20250514"):
         self.model = model
         self._call_count = 0
+        self._call_lock = threading.Lock()  # Aspects query concurrently
         # Uncomment below when ready:
         # self.client = anthropic.Anthropic()  # Uses ANTHROPIC_API_KEY env var
     
@@ -303,7 +487,8 @@ class AnthropicLLMClient(LLMClient):
             system_prompt: Aspect-specific system prompt with priorities
             max_tokens: Maximum response tokens (default 256 for speed)
         """
-        self._call_count += 1
+        with self._call_lock:
+            self._call_count += 1
         
         # === UNCOMMENT BELOW FOR REAL API CALLS ===
         # try:
@@ -325,6 +510,84 @@ class AnthropicLLMClient(LLMClient):
         )
 
 
+class CachingLLMClient(LLMClient):
+    """Exact-match LRU response cache in front of another LLMClient.
+    
+    Aspect prompts are templated from the deliberation package, so repeat
+    situations produce byte-identical (system_prompt, prompt) pairs. Those
+    are answered from cache instead of issuing another query. Only wrap
+    clients whose responses may be reused for identical prompts.
+    
+    Thread-safe, since the Conscious Layer queries Aspects concurrently.
+    """
+    
+    def __init__(self, client: LLMClient, max_entries: int = 4096):
+        self._client = client
+        self._max_entries = max_entries
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    @property
+    def SUPPORTS_BATCH(self) -> bool:
+        return self._client.SUPPORTS_BATCH
+    
+    @staticmethod
+    def _cache_key(prompt: str, system_prompt: Optional[str], max_tokens: int) -> bytes:
+        text = f"{system_prompt or ''}\x00{prompt}\x00{max_tokens}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _lookup(self, key: bytes) -> Optional[str]:
+        """Cached response for key, or None (counts the hit or miss). Hold _lock."""
+        response = self._cache.get(key)
+        if response is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        return response
+    
+    def _store(self, key: bytes, response: str):
+        """Cache response, evicting least recently used entries. Hold _lock."""
+        self._cache[key] = response
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+    
+    def query(self, prompt: str, system_prompt: Optional[str] = None,
+              max_tokens: int = 256) -> str:
+        key = self._cache_key(prompt, system_prompt, max_tokens)
+        with self._lock:
+            response = self._lookup(key)
+        if response is not None:
+            return response
+        
+        # Query outside the lock so concurrent misses are not serialized
+        response = self._client.query(prompt, system_prompt, max_tokens=max_tokens)
+        with self._lock:
+            self._store(key, response)
+        return response
+    
+    def query_batch(self, requests: List[Tuple[str, Optional[str]]],
+                    max_tokens: int = 256) -> List[str]:
+        keys = [self._cache_key(prompt, system_prompt, max_tokens)
+                for prompt, system_prompt in requests]
+        with self._lock:
+            responses = [self._lookup(key) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if not misses:
+            return responses
+        
+        # Only the misses go to the wrapped client, still as one batch
+        fetched = self._client.query_batch([requests[i] for i in misses], max_tokens=max_tokens)
+        with self._lock:
+            for i, response in zip(misses, fetched):
+                self._store(keys[i], response)
+                responses[i] = response
+        return responses
+
+
 # ============================================================================
 # PART 3: GROUNDED HARM ONTOLOGY
 # ============================================================================
@@ -432,12 +695,50 @@ class GroundedHarmOntology:
     # Notable threshold - logged and monitored
     NOTABLE_THRESHOLD = 0.15
     
+    # Row/column positions in the lookup tables used by calculate_harm_batch
+    DIMENSION_INDEX = {dimension: i for i, dimension in enumerate(HarmDimension)}
+    SEVERITY_INDEX = {severity: i for i, severity in enumerate(SeverityLevel)}
+    ENTITY_TYPE_INDEX = {etype: i for i, etype in enumerate(EntityType)}
+    
+    # Record layout of calculate_harm_batch(..., breakdown=True); fields carry
+    # the numeric parts of calculate_harm's result under the same keys
+    HARM_BREAKDOWN_DTYPE = np.dtype([
+        ('base_weight', np.float64),
+        ('entity_modifier', np.float64),
+        ('context_product', np.float64),
+        ('gross_harm', np.float64),
+        ('exception_reduction', np.float64),
+        ('net_harm', np.float64),
+        ('exceeds_veto', np.bool_),
+        ('exceeds_caution', np.bool_),
+    ])
+    
     def __init__(self):
         self._dimension_profiles = self._build_dimension_profiles()
         self._entity_modifiers = self._build_entity_modifiers()
         self._context_modifiers = self._build_context_modifiers()
         self._exceptions = self._build_exceptions()
         self._checksum = self._compute_checksum()
+        self._justifications: Optional[Dict[str, str]] = None  # get_all_justifications, on first use
+        
+        # Flat lookups for the modifier getters; the profiles are frozen, so these
+        # never go stale. The first entry wins for a repeated level name, as in
+        # the linear scan they replace.
+        self._entity_modifier_lookup: Dict[EntityType, float] = {
+            etype: mod.modifier for etype, mod in self._entity_modifiers.items()
+        }
+        self._context_modifier_lookup: Dict[Tuple[str, str], float] = {}
+        for context_type, ctx in self._context_modifiers.items():
+            for level_name, modifier, _ in ctx.levels:
+                self._context_modifier_lookup.setdefault((context_type, level_name), modifier)
+        
+        # Dense copies of the dimension weights (dimension x severity) and entity
+        # modifiers, for calculate_harm_batch
+        self._dimension_weight_table = np.array([
+            [self.get_dimension_weight(dimension, severity) for severity in SeverityLevel]
+            for dimension in HarmDimension
+        ])
+        self._entity_modifier_table = np.array([self.get_entity_modifier(etype) for etype in EntityType])
         
         # Inertia tracking - how much evidence needed to shift weights
         self._update_counts: Dict[str, int] = {}  # Track attempted updates
@@ -860,19 +1161,11 @@ class GroundedHarmOntology:
     
     def get_entity_modifier(self, entity_type: EntityType) -> float:
         """Get modifier for an entity type."""
-        mod = self._entity_modifiers.get(entity_type)
-        if mod:
-            return mod.modifier
-        return 1.0  # Default to human baseline
+        return self._entity_modifier_lookup.get(entity_type, 1.0)  # Default to human baseline
     
     def get_context_modifier(self, context_type: str, level: str) -> float:
         """Get contextual modifier value."""
-        context = self._context_modifiers.get(context_type)
-        if context:
-            for level_name, modifier, _ in context.levels:
-                if level_name == level:
-                    return modifier
-        return 1.0  # Default baseline
+        return self._context_modifier_lookup.get((context_type, level), 1.0)  # Default baseline
     
     def get_exception_reduction(self, exception: ExceptionType, 
                                  verification_status: Dict[str, bool]) -> float:
@@ -903,8 +1196,17 @@ class GroundedHarmOntology:
             return exc_def.max_harm_reduction * proportion_met
         
         return 0.0
-    
-    def calculate_harm(self, 
+
+    def get_max_exception_reduction(self) -> float:
+        """Upper bound on harm reduction if every exception applied in full.
+
+        Used by the Unconscious Layer to stop assessing an action once its
+        harm is high enough that no combination of exceptions could bring
+        it back under the veto threshold.
+        """
+        return sum(exc_def.max_harm_reduction for exc_def in self._exceptions.values())
+
+    def calculate_harm(self,
                        dimension: HarmDimension,
                        severity: SeverityLevel,
                        entity_type: EntityType,
@@ -969,6 +1271,67 @@ class GroundedHarmOntology:
             'exceeds_caution': net_harm > self.CAUTION_THRESHOLD,
         }
     
+    def calculate_harm_batch(self,
+                             dimensions: List[HarmDimension],
+                             severities: List[SeverityLevel],
+                             entity_types: List[EntityType],
+                             contexts: Optional[List[Optional[Dict[str, str]]]] = None,
+                             exceptions: Optional[List[Optional[Dict[ExceptionType, Dict[str, bool]]]]] = None,
+                             breakdown: bool = False) -> np.ndarray:
+        """net_harm of calculate_harm for each position of the argument lists.
+        
+        Dimension weights and entity modifiers are gathered from dense tables
+        in one pass; contexts and exceptions, when given, hold one (possibly
+        None) dict per position. Results match calculate_harm exactly.
+        
+        With breakdown=True a HARM_BREAKDOWN_DTYPE record array is returned
+        instead, so each element can be read like calculate_harm's dict.
+        """
+        dim_idx = np.fromiter((self.DIMENSION_INDEX[d] for d in dimensions), dtype=np.intp)
+        sev_idx = np.fromiter((self.SEVERITY_INDEX[s] for s in severities), dtype=np.intp)
+        ent_idx = np.fromiter((self.ENTITY_TYPE_INDEX[e] for e in entity_types), dtype=np.intp)
+        base_weights = self._dimension_weight_table[dim_idx, sev_idx]
+        entity_modifiers = self._entity_modifier_table[ent_idx]
+        harm = base_weights * entity_modifiers
+        
+        context_products = np.ones(len(harm))
+        if contexts is not None:
+            # Products are accumulated in each dict's order, as in calculate_harm
+            for i, context in enumerate(contexts):
+                if context:
+                    product = 1.0
+                    for ctx_type, level in context.items():
+                        product *= self.get_context_modifier(ctx_type, level)
+                    context_products[i] = product
+            harm *= context_products
+        gross_harm = harm
+        
+        reductions = np.zeros(len(harm))
+        if exceptions is not None:
+            for i, claimed in enumerate(exceptions):
+                if claimed:
+                    total = 0.0
+                    for exc_type, verification in claimed.items():
+                        total += self.get_exception_reduction(exc_type, verification)
+                    reductions[i] = total
+            harm = gross_harm - reductions
+        
+        # Net harm (floor at 0)
+        net_harm = np.maximum(harm, 0.0)
+        if not breakdown:
+            return net_harm
+        
+        records = np.empty(len(net_harm), dtype=self.HARM_BREAKDOWN_DTYPE)
+        records['base_weight'] = base_weights
+        records['entity_modifier'] = entity_modifiers
+        records['context_product'] = context_products
+        records['gross_harm'] = gross_harm
+        records['exception_reduction'] = reductions
+        records['net_harm'] = net_harm
+        records['exceeds_veto'] = net_harm > self.VETO_THRESHOLD
+        records['exceeds_caution'] = net_harm > self.CAUTION_THRESHOLD
+        return records
+    
     def get_severity_from_indicators(self, indicators: Dict[str, Any]) -> SeverityLevel:
         """Estimate severity level from situational indicators.
         
@@ -990,7 +1353,17 @@ class GroundedHarmOntology:
         return SeverityLevel.MODERATE
     
     def get_all_justifications(self) -> Dict[str, str]:
-        """Get all grounding justifications for transparency."""
+        """Get all grounding justifications for transparency.
+        
+        The profiles are frozen, so the table is built once; each call returns
+        a fresh copy, so callers may modify it.
+        """
+        justifications = self._justifications
+        if justifications is None:
+            justifications = self._justifications = self._build_justifications()
+        return dict(justifications)
+    
+    def _build_justifications(self) -> Dict[str, str]:
         justifications = {}
         
         for dim, profile in self._dimension_profiles.items():
@@ -1497,6 +1870,7 @@ class EmbodimentVerificationSubsystem:
         self._cached_srs: Optional[float] = None
         self._cached_mcs: Optional[float] = None
         self._cached_ces: Optional[float] = None
+        self._cached_report: Optional[Dict[str, Any]] = None  # get_full_report, until invalidate()
         self._degradation_log: List[Dict[str, Any]] = []
         
         # Compute initial metrics from embodiment
@@ -1811,14 +2185,37 @@ class EmbodimentVerificationSubsystem:
             'severity': severity,
             'reason': reason
         })
+        self.invalidate()
+    
+    def invalidate(self):
+        """Drop cached scores and the cached report.
         
-        # Invalidate cached scores
+        Called on degradation; call it after reconfiguring sensor or
+        actuator metrics directly.
+        """
         self._cached_srs = None
         self._cached_mcs = None
         self._cached_ces = None
+        self._cached_report = None
     
     def get_full_report(self) -> Dict[str, Any]:
-        """Get comprehensive EVS report."""
+        """Get comprehensive EVS report.
+        
+        Built once and cached until invalidate(); each call returns a fresh
+        copy, so callers may modify it.
+        """
+        report = self._cached_report
+        if report is None:
+            report = self._cached_report = self._build_full_report()
+        return {
+            **report,
+            'allowed_capabilities': list(report['allowed_capabilities']),
+            'sensor_metrics': {name: dict(m) for name, m in report['sensor_metrics'].items()},
+            'actuator_metrics': {name: dict(m) for name, m in report['actuator_metrics'].items()},
+            'thresholds': dict(report['thresholds']),
+        }
+    
+    def _build_full_report(self) -> Dict[str, Any]:
         srs = self.compute_sensory_richness_score()
         mcs = self.compute_motor_competence_score()
         ces = self.compute_combined_embodiment_score()
@@ -1900,6 +2297,22 @@ class UndeliberableViolation:
     details: str
 
 
+def _keyword_pattern(keywords) -> 're.Pattern':
+    """One compiled search matching wherever any of the keywords occurs.
+    
+    Alternatives are grouped under their first character, so each text position
+    is tested against a handful of keywords instead of all of them. Longer
+    keywords are tried first, so a match reports the longest keyword starting
+    at the leftmost matching position.
+    """
+    groups: Dict[str, List[str]] = {}
+    for keyword in sorted(keywords, key=lambda k: (-len(k), k)):
+        groups.setdefault(keyword[0], []).append(re.escape(keyword[1:]))
+    return re.compile('|'.join(
+        f"{re.escape(first)}(?:{'|'.join(rests)})" for first, rests in sorted(groups.items())
+    ))
+
+
 class UndeliberableRegistry:
     """The 'Immediately No' list.
     
@@ -1927,6 +2340,7 @@ class UndeliberableRegistry:
         'nuclear weapon', 'radiological', 'dirty bomb',
         'missile', 'warhead', 'ammunition', 'ammo',
     ])
+    WEAPON_PATTERN = _keyword_pattern(WEAPON_KEYWORDS)
     
     # The five undeliberables
     LETHAL_ACTION = Undeliberable(
@@ -1969,13 +2383,7 @@ class UndeliberableRegistry:
         """
         # 1. Human override (highest priority - immediate halt)
         if cls._check_human_override(state):
-            return UndeliberableViolation(
-                undeliberable=cls.HUMAN_OVERRIDE,
-                commands=commands,
-                state_snapshot={'override_active': True},
-                timestamp=time.time(),
-                details="Human override command detected"
-            )
+            return cls._human_override_violation(commands)
         
         # 2. Lethal action
         lethal_prob, lethal_details = cls._check_lethal_action(commands, state)
@@ -2026,15 +2434,30 @@ class UndeliberableRegistry:
     @classmethod
     def _check_human_override(cls, state: 'EmbodimentState') -> bool:
         """Check if human has issued stop command."""
-        # Check environment for override signal
-        if state.environment.get('human_override', False):
+        return cls._override_signalled(state.environment)
+    
+    @staticmethod
+    def _override_signalled(environment: Dict[str, Any]) -> bool:
+        """Check an environment dict for an override signal."""
+        if environment.get('human_override', False):
             return True
-        if state.environment.get('stop_commanded', False):
+        if environment.get('stop_commanded', False):
             return True
-        if state.environment.get('emergency_stop', False):
+        if environment.get('emergency_stop', False):
             return True
         return False
     
+    @classmethod
+    def _human_override_violation(cls, commands: List[Dict[str, Any]]) -> UndeliberableViolation:
+        """Violation record for commands issued while an override is active."""
+        return UndeliberableViolation(
+            undeliberable=cls.HUMAN_OVERRIDE,
+            commands=commands,
+            state_snapshot={'override_active': True},
+            timestamp=time.time(),
+            details="Human override command detected"
+        )
+    
     @classmethod
     def _check_lethal_action(cls, commands: List[Dict[str, Any]], 
                              state: 'EmbodimentState') -> Tuple[float, str]:
@@ -2053,12 +2476,12 @@ class UndeliberableRegistry:
         if not humans:
             return 0.0, "No humans detected"
         
-        # Check environment for hazards
-        env_hazards = state.environment.get('hazards', [])
-        near_traffic = 'traffic' in str(env_hazards).lower()
-        near_heights = 'height' in str(env_hazards).lower() or 'fall' in str(env_hazards).lower()
-        near_machinery = 'machine' in str(env_hazards).lower() or 'equipment' in str(env_hazards).lower()
-        near_water = 'water' in str(env_hazards).lower() or 'drown' in str(env_hazards).lower()
+        # Check environment for hazards (rendered to text once for all keywords)
+        env_hazards = str(state.environment.get('hazards', [])).lower()
+        near_traffic = 'traffic' in env_hazards
+        near_heights = 'height' in env_hazards or 'fall' in env_hazards
+        near_machinery = 'machine' in env_hazards or 'equipment' in env_hazards
+        near_water = 'water' in env_hazards or 'drown' in env_hazards
         
         for cmd in commands:
             cmd_type = cmd.get('type', '')
@@ -2150,19 +2573,17 @@ class UndeliberableRegistry:
                           state: 'EmbodimentState') -> Tuple[bool, str]:
         """Detect actions targeting children for harmful purpose."""
         
-        # Identify children in environment
-        children = []
-        for entity in state.detected_entities:
-            if cls._is_child(entity):
-                children.append(entity)
+        # Identify children in environment (each entity is classified once)
+        entities = state.detected_entities
+        child_flags = [cls._is_child(entity) for entity in entities]
+        children = [entity for entity, is_child in zip(entities, child_flags) if is_child]
         
         if not children:
             return False, ""
         
         # Check for caregivers present
-        caregivers = [e for e in state.detected_entities 
-                     if e.entity_type == EntityType.HUMAN and not cls._is_child(e)]
-        caregiver_present = len(caregivers) > 0
+        caregiver_present = any(e.entity_type == EntityType.HUMAN and not is_child
+                                for e, is_child in zip(entities, child_flags))
         
         for cmd in commands:
             cmd_type = cmd.get('type', '')
@@ -2200,7 +2621,7 @@ class UndeliberableRegistry:
     @classmethod
     def _is_child(cls, entity: DetectedEntity) -> bool:
         """Determine if entity is a child."""
-        description = entity.description.lower()
+        description = entity.description_lower
         state = entity.state
         
         # Explicit child indicators
@@ -2243,9 +2664,9 @@ class UndeliberableRegistry:
                         return True, f"Attempted manipulation of weapon: {weapon.description}"
                 
                 # Check if target contains weapon keywords
-                for keyword in cls.WEAPON_KEYWORDS:
-                    if keyword in target:
-                        return True, f"Attempted manipulation of weapon-related object: {keyword}"
+                match = cls.WEAPON_PATTERN.search(target)
+                if match:
+                    return True, f"Attempted manipulation of weapon-related object: {match.group()}"
             
             # Speech containing weapon construction info
             if cmd_type == 'SPEAK':
@@ -2264,14 +2685,10 @@ class UndeliberableRegistry:
     @classmethod
     def _is_weapon(cls, entity: DetectedEntity) -> bool:
         """Determine if entity is a human-killing instrument."""
-        description = entity.description.lower()
+        description = entity.description_lower
         obj_type = str(entity.state.get('object_type', '')).lower()
         
-        for keyword in cls.WEAPON_KEYWORDS:
-            if keyword in description or keyword in obj_type:
-                return True
-        
-        return False
+        return bool(cls.WEAPON_PATTERN.search(description) or cls.WEAPON_PATTERN.search(obj_type))
     
     @classmethod
     def _contains_weapon_instructions(cls, text: str) -> bool:
@@ -2283,7 +2700,7 @@ class UndeliberableRegistry:
                             'create', 'manufacture', 'synthesize', 'instructions']
         
         has_instruction = any(w in text_lower for w in instruction_words)
-        has_weapon = any(w in text_lower for w in cls.WEAPON_KEYWORDS)
+        has_weapon = cls.WEAPON_PATTERN.search(text_lower) is not None
         
         return has_instruction and has_weapon
     
@@ -2344,6 +2761,9 @@ class EmbodimentLayer:
     2. VirtualEmbodiment constraints (capability limits)
     """
     
+    # Most recent violations kept in full; counts cover every violation
+    VIOLATION_LOG_SIZE = 1024
+    
     def __init__(self, virtual_embodiment: VirtualEmbodiment, sensor_buffer_size: int = 100):
         self._virtual = virtual_embodiment  # Capability definition
         self._current_time = 0.0
@@ -2353,7 +2773,8 @@ class EmbodimentLayer:
         self._detected_entities: Dict[str, DetectedEntity] = {}
         self._commands_executed = 0
         self._commands_rejected = 0
-        self._undeliberable_violations: List[UndeliberableViolation] = []
+        self._undeliberable_violations: deque = deque(maxlen=self.VIOLATION_LOG_SIZE)
+        self._violation_counts: Counter = Counter()  # (name, response) -> violations
         self._halted = False  # True if IMMEDIATE_HALT triggered
     
     @property
@@ -2387,6 +2808,38 @@ class EmbodimentLayer:
     def add_entity(self, entity: DetectedEntity):
         self._detected_entities[entity.entity_id] = entity
     
+    def add_entities(self, entities: List[DetectedEntity]):
+        """add_entity for each entity, in order."""
+        for entity in entities:
+            self.add_entity(entity)
+    
+    def snapshot(self) -> Tuple[Tuple[DetectedEntity, ...], Dict[str, Any]]:
+        """Detected entities and environment, for a later restore_snapshot()."""
+        return tuple(self._detected_entities.values()), self._environment.copy()
+    
+    def restore_snapshot(self, snapshot: Tuple[Tuple[DetectedEntity, ...], Dict[str, Any]]):
+        """Replace detected entities and environment with a snapshot() in one step.
+        
+        The snapshot itself is left untouched, so it can be restored repeatedly.
+        """
+        entities, environment = snapshot
+        self._detected_entities = {entity.entity_id: entity for entity in entities}
+        self._environment = environment.copy()
+    
+    def apply_sensor_update(self, sensor_type: str, data: Dict[str, Any],
+                            environment: Optional[Dict[str, Any]] = None,
+                            entities: Optional[List[DetectedEntity]] = None) -> EmbodimentState:
+        """update_environment, add_entities and update_from_raw_data in one call.
+        
+        Applied in that order; returns the resulting get_current_state().
+        """
+        if environment is not None:
+            self.update_environment(environment)
+        if entities:
+            self.add_entities(entities)
+        self.update_from_raw_data(sensor_type, data)
+        return self.get_current_state()
+    
     def get_current_state(self) -> EmbodimentState:
         return EmbodimentState(
             timestamp=self._current_time,
@@ -2415,12 +2868,18 @@ class EmbodimentLayer:
                 'results': []
             }
         
-        # Check undeliberables FIRST - before any other processing
-        state = self.get_current_state()
-        violation = UndeliberableRegistry.check_all(commands, state)
+        # Check undeliberables FIRST - before any other processing. An active
+        # override decides the outcome on its own, so it is checked before the
+        # full state snapshot is assembled for the remaining rules.
+        if UndeliberableRegistry._override_signalled(self._environment):
+            violation = UndeliberableRegistry._human_override_violation(commands)
+        else:
+            violation = UndeliberableRegistry.check_all(commands, self.get_current_state())
         
         if violation:
             self._undeliberable_violations.append(violation)
+            self._violation_counts[violation.undeliberable.name,
+                                   violation.undeliberable.response.value] += 1
             
             # Handle based on response type
             if violation.undeliberable.response == BlockResponse.IMMEDIATE_HALT:
@@ -2527,13 +2986,13 @@ class EmbodimentLayer:
             'entities_tracked': len(self._detected_entities),
             'commands_executed': self._commands_executed,
             'commands_rejected': self._commands_rejected,
-            'undeliberable_violations': len(self._undeliberable_violations),
+            'undeliberable_violations': sum(self._violation_counts.values()),
             'is_halted': self._halted,
             'agent_type': self._virtual.agent_type
         }
     
     def get_violation_log(self) -> List[Dict[str, Any]]:
-        """Get log of all undeliberable violations."""
+        """Get log of the most recent (up to VIOLATION_LOG_SIZE) undeliberable violations."""
         return [
             {
                 'name': v.undeliberable.name,
@@ -2544,6 +3003,13 @@ class EmbodimentLayer:
             }
             for v in self._undeliberable_violations
         ]
+    
+    def get_violation_counts(self) -> List[Dict[str, Any]]:
+        """Number of violations of each undeliberable since startup, first seen first."""
+        return [
+            {'name': name, 'response': response, 'count': count}
+            for (name, response), count in self._violation_counts.items()
+        ]
 
 
 class SimulatedEmbodiment(EmbodimentLayer):
@@ -2588,12 +3054,42 @@ class UnconsciousLayer:
     UNCERTAINTY_THRESHOLD = 0.4
     CONFIDENCE_UNCERTAINTY_WEIGHT = 0.6  # How much entity confidence affects uncertainty
     
+    # Inherent harm of each command type before command-specific adjustments
+    COMMAND_BASE_SEVERITIES = {
+        'MOVE': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
+        'STOP': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
+        'ROTATE': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
+        'SPEAK': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MINOR),
+        'DISPLAY': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MINOR),
+        'MANIPULATE': (HarmDimension.PHYSICAL, SeverityLevel.MODERATE),
+        'ALERT': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MODERATE),
+        'WAIT': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
+    }
+    DEFAULT_COMMAND_SEVERITY = (HarmDimension.PHYSICAL, SeverityLevel.MODERATE)
+    
     def __init__(self):
         """Initialize the Unconscious Layer.
         
         Note: No LLM client - this layer is purely rule-based using the ontology.
         """
         self._ontology: GroundedHarmOntology = get_ontology()
+        # Harm above this can never be reduced below the veto threshold
+        self._early_veto_bound = (self._ontology.VETO_THRESHOLD +
+                                  self._ontology.get_max_exception_reduction())
+        # cmd_type -> (dimension, severity, weight), resolved against the ontology once
+        self._command_base_harm = {
+            cmd_type: (dim, sev, self._ontology.get_dimension_weight(dim, sev))
+            for cmd_type, (dim, sev) in self.COMMAND_BASE_SEVERITIES.items()
+        }
+        default_dim, default_sev = self.DEFAULT_COMMAND_SEVERITY
+        self._default_command_base_harm = (
+            default_dim, default_sev,
+            self._ontology.get_dimension_weight(default_dim, default_sev))
+        # Exception results for the deliberation package currently being vetted
+        self._exception_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._exception_cache_package: Optional[DeliberationPackage] = None
+        # The ontology is immutable, so its checksum preview never changes
+        self._cached_checksum_preview = self._ontology.get_checksum()[:16] + '...'
         self._triggers_detected = 0
         self._vetoes_issued = 0
         self._evaluations_performed = 0
@@ -2615,20 +3111,25 @@ class UnconsciousLayer:
         - Environment uncertainty
         """
         conflicts = []
+        # Descriptions and the running max severity are accumulated
+        # alongside conflicts so no trailing passes are needed
+        descriptions = []
+        max_severity = 0.0
         involved_drives = set()
         
-        # Track uncertainty from multiple sources
-        uncertainty_sources = []
+        # Track the largest per-entity uncertainty as a running max; the
+        # descriptive source dicts are only built if an uncertainty conflict
+        # is raised. A scene holds a handful of entities, so a plain float
+        # beats filling and reducing a NumPy array (~0.1 vs ~1.6 us for three)
+        entity_max = 0.0
         
         # Check each entity against harm ontology
         for entity in state.detected_entities:
             # UNCERTAINTY: Low confidence entities trigger UNDERSTAND
             if entity.confidence < 0.7:
-                uncertainty_sources.append({
-                    'source': f"entity_{entity.entity_id}",
-                    'value': 1.0 - entity.confidence,
-                    'description': f"Low confidence ({entity.confidence:.2f}) detecting {entity.description}"
-                })
+                entity_uncertainty = 1.0 - entity.confidence
+                if entity_uncertainty > entity_max:
+                    entity_max = entity_uncertainty
             
             # Determine entity type (including child detection)
             entity_type = self._get_effective_entity_type(entity)
@@ -2638,69 +3139,85 @@ class UnconsciousLayer:
                 harm_indicators = self._check_human_harm_indicators(entity, entity_type)
                 for indicator in harm_indicators:
                     conflicts.append(indicator)
+                    descriptions.append(indicator['description'])
+                    if indicator['severity'] > max_severity:
+                        max_severity = indicator['severity']
                     involved_drives.add(CoreDrive.REDUCE_HARM)
             
             elif entity_type == EntityType.ANIMAL:
                 if entity.state.get('in_danger', False):
                     entity_mod = self._ontology.get_entity_modifier(EntityType.ANIMAL)
                     danger_level = entity.state.get('danger_level', 0.3)
+                    description = f"Animal '{entity.entity_id}' in danger"
+                    severity = danger_level * entity_mod
                     conflicts.append({
                         'type': 'potential_harm',
-                        'description': f"Animal '{entity.entity_id}' in danger",
-                        'severity': danger_level * entity_mod,
+                        'description': description,
+                        'severity': severity,
                         'entity': entity,
                         'dimension': HarmDimension.PHYSICAL
                     })
+                    descriptions.append(description)
+                    if severity > max_severity:
+                        max_severity = severity
                     involved_drives.add(CoreDrive.REDUCE_HARM)
         
         # Environment uncertainty
         env_uncertainty = state.environment.get('uncertainty', 0)
-        if env_uncertainty > 0:
-            uncertainty_sources.append({
-                'source': 'environment',
-                'value': env_uncertainty,
-                'description': f"Environmental uncertainty: {env_uncertainty:.2f}"
-            })
+        env_max = env_uncertainty if env_uncertainty > 0 else 0
         
         # Calculate aggregate uncertainty from all sources
         aggregate_uncertainty = 0.0
-        if uncertainty_sources:
-            entity_uncertainties = [s['value'] for s in uncertainty_sources 
-                                   if s['source'].startswith('entity_')]
-            env_uncertainties = [s['value'] for s in uncertainty_sources 
-                                if s['source'] == 'environment']
-            
-            entity_max = max(entity_uncertainties) if entity_uncertainties else 0
-            env_max = max(env_uncertainties) if env_uncertainties else 0
-            
+        if entity_max > 0 or env_max > 0:
             aggregate_uncertainty = (
                 entity_max * self.CONFIDENCE_UNCERTAINTY_WEIGHT +
                 env_max * (1 - self.CONFIDENCE_UNCERTAINTY_WEIGHT)
             )
             
             if aggregate_uncertainty > self.UNCERTAINTY_THRESHOLD:
+                uncertainty_sources = [
+                    {
+                        'source': f"entity_{entity.entity_id}",
+                        'value': 1.0 - entity.confidence,
+                        'description': f"Low confidence ({entity.confidence:.2f}) detecting {entity.description}"
+                    }
+                    for entity in state.detected_entities if entity.confidence < 0.7
+                ]
+                if env_max > 0:
+                    uncertainty_sources.append({
+                        'source': 'environment',
+                        'value': env_uncertainty,
+                        'description': f"Environmental uncertainty: {env_uncertainty:.2f}"
+                    })
+                description = "; ".join(s['description'] for s in uncertainty_sources)
                 conflicts.append({
                     'type': 'uncertainty',
-                    'description': "; ".join(s['description'] for s in uncertainty_sources),
+                    'description': description,
                     'severity': aggregate_uncertainty,
                     'sources': uncertainty_sources
                 })
+                descriptions.append(description)
+                if aggregate_uncertainty > max_severity:
+                    max_severity = aggregate_uncertainty
                 involved_drives.add(CoreDrive.UNDERSTAND)
         
         # Check for IMPROVE opportunities (lower priority)
         for entity in state.detected_entities:
             if entity.entity_type == EntityType.HUMAN:
                 if entity.state.get('could_benefit_from_help', False) and entity.confidence > 0.6:
+                    description = f"Opportunity to assist '{entity.entity_id}'"
                     conflicts.append({
                         'type': 'improvement_opportunity',
-                        'description': f"Opportunity to assist '{entity.entity_id}'",
+                        'description': description,
                         'severity': 0.35,
                         'entity': entity
                     })
+                    descriptions.append(description)
+                    if 0.35 > max_severity:
+                        max_severity = 0.35
                     involved_drives.add(CoreDrive.IMPROVE)
         
         # Determine if deliberation needed
-        max_severity = max([c['severity'] for c in conflicts], default=0)
         if max_severity < self.CONFLICT_THRESHOLD:
             return None
         
@@ -2710,10 +3227,10 @@ class UnconsciousLayer:
             timestamp=state.timestamp,
             trigger_type="conflict" if CoreDrive.REDUCE_HARM in involved_drives else "uncertainty",
             involved_drives=list(involved_drives),
-            situation_description="; ".join(c['description'] for c in conflicts),
+            situation_description="; ".join(descriptions),
             relevant_entities=state.detected_entities,
             severity=max_severity,
-            certainty=1.0 - (aggregate_uncertainty if uncertainty_sources else 0),
+            certainty=1.0 - aggregate_uncertainty,
             time_pressure=0.5 if max_severity > 0.6 else 0.2,
             embodiment_state=state,
             trigger_details={'conflicts': conflicts}
@@ -2727,7 +3244,7 @@ class UnconsciousLayer:
         if entity.entity_type == EntityType.HUMAN:
             # Check if this human is actually a child
             state = entity.state
-            description = entity.description.lower()
+            description = entity.description_lower
             
             # Age-based
             age = state.get('age', state.get('estimated_age', None))
@@ -2753,6 +3270,8 @@ class UnconsciousLayer:
         indicators = []
         state = entity.state
         entity_mod = self._ontology.get_entity_modifier(entity_type)
+        label = 'Child' if entity_type == EntityType.CHILD else 'Human'
+        eid = entity.entity_id
         
         # Physical harm indicators
         if state.get('near_hazard', False) or state.get('in_danger', False):
@@ -2765,7 +3284,7 @@ class UnconsciousLayer:
             
             indicators.append({
                 'type': 'potential_physical_harm',
-                'description': f"{'Child' if entity_type == EntityType.CHILD else 'Human'} '{entity.entity_id}' near hazard: {state.get('hazard_type', 'unknown')}",
+                'description': f"{label} '{eid}' near hazard: {state.get('hazard_type', 'unknown')}",
                 'severity': base_weight * entity_mod * confidence_factor,
                 'entity': entity,
                 'dimension': HarmDimension.PHYSICAL,
@@ -2780,7 +3299,7 @@ class UnconsciousLayer:
             
             indicators.append({
                 'type': 'potential_psychological_harm',
-                'description': f"{'Child' if entity_type == EntityType.CHILD else 'Human'} '{entity.entity_id}' showing distress",
+                'description': f"{label} '{eid}' showing distress",
                 'severity': base_weight * entity_mod,
                 'entity': entity,
                 'dimension': HarmDimension.PSYCHOLOGICAL,
@@ -2792,7 +3311,7 @@ class UnconsciousLayer:
             base_weight = self._ontology.get_dimension_weight(HarmDimension.AUTONOMY, SeverityLevel.MODERATE)
             indicators.append({
                 'type': 'autonomy_consideration',
-                'description': f"Human '{entity.entity_id}' requesting assistance",
+                'description': f"Human '{eid}' requesting assistance",
                 'severity': base_weight * entity_mod,
                 'entity': entity,
                 'dimension': HarmDimension.AUTONOMY,
@@ -2840,6 +3359,12 @@ class UnconsciousLayer:
         """
         self._evaluations_performed += 1
         
+        # Proposals from one deliberation share a package; start a fresh
+        # exception cache whenever a new one arrives
+        if context is not self._exception_cache_package:
+            self._exception_cache.clear()
+            self._exception_cache_package = context
+        
         harm_assessment = self._assess_action_harm(action, context)
         
         # Apply veto logic using ontology threshold
@@ -2854,6 +3379,18 @@ class UnconsciousLayer:
             reasons.append(f"Net harm ({net_harm:.2f}) exceeds threshold ({self._ontology.VETO_THRESHOLD})")
             violated_drives.append(CoreDrive.REDUCE_HARM)
         
+        # Early-vetoed assessments skipped exception checks, so the
+        # per-dimension "without exception" reasons would be misleading
+        if harm_assessment.get('early_vetoed'):
+            self._vetoes_issued += 1
+            return VetoDecision(
+                action=action,
+                vetoed=True,
+                reasons=reasons,
+                violated_drives=violated_drives,
+                harm_assessment=harm_assessment
+            )
+        
         # Check individual high-severity harms (using caution threshold)
         for dim, score in harm_assessment.get('by_dimension', {}).items():
             if score > self._ontology.CAUTION_THRESHOLD * 2:  # High individual harm
@@ -2891,28 +3428,56 @@ class UnconsciousLayer:
         context_mods = self._determine_context_modifiers(action, context)
         assessment['context_modifiers'] = context_mods
         
+        # Context product is the same for every command and entity
+        context_product = self._compute_context_product(context_mods)
+        
+        # Per-dimension maxima are merged in place and the overall worst
+        # score is tracked alongside, so no rescans of by_dimension are needed
+        by_dimension = assessment['by_dimension']
+        total_harm = 0.0
+        
         # Analyze each command
         for cmd in action.action_commands:
-            cmd_harm = self._analyze_command_harm(cmd, context, context_mods)
-            for dim, score in cmd_harm.get('dimensions', {}).items():
-                current = assessment['by_dimension'].get(dim, 0)
-                assessment['by_dimension'][dim] = max(current, score)
-            assessment['analysis'].extend(cmd_harm.get('analysis', []))
+            cmd_harm = self._analyze_command_harm(cmd, context, context_product)
+            for dim, score in cmd_harm.dimensions.items():
+                if dim not in by_dimension or score > by_dimension[dim]:
+                    by_dimension[dim] = score
+                    if score > total_harm:
+                        total_harm = score
+            assessment['analysis'].extend(cmd_harm.analysis)
+            if self._exceeds_early_veto_bound(assessment, total_harm):
+                return assessment
         
         # Check for affected entities
         affected_entities = self._identify_affected_entities(action, context)
+        dimension_weights = (self._resolve_dimension_weights(
+                                 self._estimate_action_dimension_severities(action))
+                             if affected_entities else [])
+        # With the action fixed, entity harm depends only on the effective
+        # entity type, so each type is scored once and reused
+        harm_by_type: Dict[EntityType, HarmContribution] = {}
         for entity in affected_entities:
             entity_type = self._get_effective_entity_type(entity)
-            entity_harm = self._assess_entity_harm(action, entity, entity_type, context_mods)
-            assessment['by_entity'][entity.entity_id] = entity_harm
+            entity_harm = harm_by_type.get(entity_type)
+            if entity_harm is None:
+                entity_harm = self._assess_entity_harm(entity_type, dimension_weights,
+                                                       context_product)
+                harm_by_type[entity_type] = entity_harm
+            assessment['by_entity'][entity.entity_id] = {
+                'dimensions': dict(entity_harm.dimensions),
+                'analysis': list(entity_harm.analysis),
+            }
             
-            for dim, score in entity_harm.get('dimensions', {}).items():
-                current = assessment['by_dimension'].get(dim, 0)
-                assessment['by_dimension'][dim] = max(current, score)
+            for dim, score in entity_harm.dimensions.items():
+                if dim not in by_dimension or score > by_dimension[dim]:
+                    by_dimension[dim] = score
+                    if score > total_harm:
+                        total_harm = score
+            if self._exceeds_early_veto_bound(assessment, total_harm):
+                return assessment
         
-        # Calculate total harm
-        if assessment['by_dimension']:
-            assessment['total_harm'] = max(assessment['by_dimension'].values())
+        # Total harm is the worst dimension
+        assessment['total_harm'] = total_harm
         
         # Check for applicable exceptions
         exceptions = self._check_exceptions(action, context, assessment)
@@ -2925,6 +3490,25 @@ class UnconsciousLayer:
         
         return assessment
     
+    def _exceeds_early_veto_bound(self, assessment: Dict[str, Any], total_harm: float) -> bool:
+        """Mark assessment as vetoed if no exception could save the action.
+        
+        Once the worst dimension (total_harm) exceeds VETO_THRESHOLD plus the
+        largest possible exception reduction, the remaining commands, entities
+        and exception checks cannot change the outcome.
+        """
+        if total_harm <= self._early_veto_bound:
+            return False
+        
+        assessment['total_harm'] = total_harm
+        # Lower bound on net harm - exceptions were not evaluated
+        assessment['net_harm'] = total_harm - self._ontology.get_max_exception_reduction()
+        assessment['early_vetoed'] = True
+        assessment['analysis'].append(
+            f"Harm ({total_harm:.2f}) exceeds veto threshold even with all exceptions - assessment stopped early"
+        )
+        return True
+    
     def _determine_context_modifiers(self, action: ProposedAction, 
                                       context: DeliberationPackage) -> Dict[str, str]:
         """Determine applicable context modifier levels."""
@@ -2934,7 +3518,7 @@ class UnconsciousLayer:
         reversible_actions = ['SPEAK', 'DISPLAY', 'ALERT', 'WAIT', 'ROTATE']
         irreversible_indicators = ['destroy', 'kill', 'delete', 'permanent']
         
-        action_desc = action.action_description.lower()
+        action_desc = action.description_lower
         if any(w in action_desc for w in irreversible_indicators):
             mods['reversibility'] = 'irreversible'
         elif any(cmd.get('type') in reversible_actions for cmd in action.action_commands):
@@ -2942,81 +3526,75 @@ class UnconsciousLayer:
         else:
             mods['reversibility'] = 'reversible'
         
-        # Consent - check if entities have consented
+        # Consent, relationship and vulnerability are each taken from the first
+        # entity that indicates them; resolve all three in a single pass
+        consent = relationship = vulnerability = None
         for entity in context.impetus.relevant_entities:
-            if entity.state.get('refused', False):
-                mods['consent'] = 'explicit_refusal'
-                break
-            elif entity.state.get('consented', False):
-                entity_type = self._get_effective_entity_type(entity)
+            state = entity.state
+            entity_type = None
+            
+            # Consent - check if entities have consented
+            if consent is None:
+                if state.get('refused', False):
+                    consent = 'explicit_refusal'
+                elif state.get('consented', False):
+                    entity_type = self._get_effective_entity_type(entity)
+                    if entity_type == EntityType.CHILD:
+                        consent = 'explicit_consent_vulnerable'
+                    else:
+                        consent = 'explicit_consent'
+            
+            # Relationship - check if entities are in agent's care
+            if relationship is None:
+                if state.get('in_care', False):
+                    relationship = 'in_care'
+                elif state.get('requested_help', False):
+                    relationship = 'requested_help'
+            
+            # Vulnerability - check entities
+            if vulnerability is None:
+                if entity_type is None:
+                    entity_type = self._get_effective_entity_type(entity)
                 if entity_type == EntityType.CHILD:
-                    mods['consent'] = 'explicit_consent_vulnerable'
-                else:
-                    mods['consent'] = 'explicit_consent'
+                    vulnerability = 'highly_vulnerable'
+                elif state.get('vulnerable', False) or state.get('elderly', False):
+                    vulnerability = 'vulnerable'
+            
+            if consent and relationship and vulnerability:
                 break
-        else:
-            mods['consent'] = 'no_consent'
         
-        # Relationship - check if entities are in agent's care
-        for entity in context.impetus.relevant_entities:
-            if entity.state.get('in_care', False):
-                mods['relationship'] = 'in_care'
-                break
-            elif entity.state.get('requested_help', False):
-                mods['relationship'] = 'requested_help'
-                break
-        else:
-            mods['relationship'] = 'stranger'
+        mods['consent'] = consent or 'no_consent'
+        mods['relationship'] = relationship or 'stranger'
         
         # Intent - based on action rationale
-        if 'harm' in action.rationale.lower() or 'hurt' in action.rationale.lower():
+        rationale_lower = action.rationale_lower
+        if 'harm' in rationale_lower or 'hurt' in rationale_lower:
             mods['intent'] = 'harm_intended'
         else:
             mods['intent'] = 'harm_foreseen'
         
-        # Vulnerability - check entities
-        for entity in context.impetus.relevant_entities:
-            entity_type = self._get_effective_entity_type(entity)
-            if entity_type == EntityType.CHILD:
-                mods['vulnerability'] = 'highly_vulnerable'
-                break
-            elif entity.state.get('vulnerable', False) or entity.state.get('elderly', False):
-                mods['vulnerability'] = 'vulnerable'
-                break
-        else:
-            mods['vulnerability'] = 'normal'
+        mods['vulnerability'] = vulnerability or 'normal'
         
         return mods
     
+    def _compute_context_product(self, context_mods: Dict[str, str]) -> float:
+        """Multiply the ontology modifiers for the chosen context levels."""
+        context_product = 1.0
+        for ctx_type, level in context_mods.items():
+            context_product *= self._ontology.get_context_modifier(ctx_type, level)
+        return context_product
+    
     def _analyze_command_harm(self, cmd: Dict[str, Any], 
                              context: DeliberationPackage,
-                             context_mods: Dict[str, str]) -> Dict[str, Any]:
+                             context_product: float) -> HarmContribution:
         """Analyze inherent harm potential of a command using grounded ontology."""
-        result = {'dimensions': {}, 'analysis': []}
+        result = HarmContribution(dimensions={}, analysis=[])
         cmd_type = cmd.get('type', '')
         
-        # Base severity by command type
-        command_severities = {
-            'MOVE': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
-            'STOP': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
-            'ROTATE': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
-            'SPEAK': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MINOR),
-            'DISPLAY': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MINOR),
-            'MANIPULATE': (HarmDimension.PHYSICAL, SeverityLevel.MODERATE),
-            'ALERT': (HarmDimension.PSYCHOLOGICAL, SeverityLevel.MODERATE),
-            'WAIT': (HarmDimension.PHYSICAL, SeverityLevel.MINOR),
-        }
-        
-        base_dim, base_severity = command_severities.get(cmd_type, (HarmDimension.PHYSICAL, SeverityLevel.MODERATE))
-        
-        # Get base weight from ontology
-        base_weight = self._ontology.get_dimension_weight(base_dim, base_severity)
-        
-        # Apply context modifiers
-        context_product = 1.0
-        for ctx_type, level in context_mods.items():
-            mod = self._ontology.get_context_modifier(ctx_type, level)
-            context_product *= mod
+        # Base severity and its precomputed ontology weight by command type
+        base_dim, base_severity, base_weight = self._command_base_harm.get(
+            cmd_type, self._default_command_base_harm)
+        adjusted_severity = base_severity
         
         # Command-specific adjustments
         if cmd_type == 'MANIPULATE':
@@ -3024,31 +3602,34 @@ class UnconsciousLayer:
             action_type = str(cmd.get('action', '')).lower()
             
             if force > 5:
-                base_severity = SeverityLevel.SIGNIFICANT
-                result['analysis'].append(f"High force ({force}) increases harm potential")
+                adjusted_severity = SeverityLevel.SIGNIFICANT
+                result.analysis.append(f"High force ({force}) increases harm potential")
             
             if any(w in action_type for w in ['push', 'pull', 'grab', 'restrain']):
-                base_severity = SeverityLevel.SIGNIFICANT
+                adjusted_severity = SeverityLevel.SIGNIFICANT
                 # Also add autonomy dimension
                 autonomy_weight = self._ontology.get_dimension_weight(HarmDimension.AUTONOMY, SeverityLevel.MODERATE)
-                result['dimensions'][HarmDimension.AUTONOMY.value] = autonomy_weight * context_product
-                result['analysis'].append(f"Action '{action_type}' has autonomy implications")
+                result.dimensions[HarmDimension.AUTONOMY.value] = autonomy_weight * context_product
+                result.analysis.append(f"Action '{action_type}' has autonomy implications")
         
         if cmd_type == 'MOVE':
             speed = cmd.get('speed', 0)
             if speed > 1.0:
-                base_severity = SeverityLevel.MODERATE
-                result['analysis'].append(f"High speed ({speed}) increases collision risk")
+                adjusted_severity = SeverityLevel.MODERATE
+                result.analysis.append(f"High speed ({speed}) increases collision risk")
         
         if cmd_type == 'SPEAK':
             volume = cmd.get('volume', 0.5)
             if volume > 0.8:
-                base_severity = SeverityLevel.MODERATE
-                result['analysis'].append("High volume speech may cause distress")
+                adjusted_severity = SeverityLevel.MODERATE
+                result.analysis.append("High volume speech may cause distress")
         
-        # Recalculate with any severity adjustments
-        final_weight = self._ontology.get_dimension_weight(base_dim, base_severity)
-        result['dimensions'][base_dim.value] = final_weight * context_product
+        # Only look the weight up again if an adjustment changed the severity
+        if adjusted_severity is base_severity:
+            final_weight = base_weight
+        else:
+            final_weight = self._ontology.get_dimension_weight(base_dim, adjusted_severity)
+        result.dimensions[base_dim.value] = final_weight * context_product
         
         return result
     
@@ -3063,8 +3644,9 @@ class UnconsciousLayer:
             
             # Direct targeting
             if target:
+                target_lower = str(target).lower()
                 for entity in context.impetus.relevant_entities:
-                    if entity.entity_id == target or str(target).lower() in entity.description.lower():
+                    if entity.entity_id == target or target_lower in entity.description_lower:
                         affected.append(entity)
             
             # Proximity-based
@@ -3076,80 +3658,121 @@ class UnconsciousLayer:
         
         return affected
     
-    def _assess_entity_harm(self, action: ProposedAction, entity: DetectedEntity,
-                           entity_type: EntityType, context_mods: Dict[str, str]) -> Dict[str, Any]:
+    def _resolve_dimension_weights(self, dimension_severities: Dict[HarmDimension, SeverityLevel]
+                                   ) -> List[Tuple[str, float]]:
+        """Look up ontology base weights for an action's per-dimension severities.
+        
+        Returned in PHYSICAL, PSYCHOLOGICAL, AUTONOMY order so entity harm
+        can be scored as a flat multiply over the list.
+        """
+        weights = []
+        for dimension in (HarmDimension.PHYSICAL, HarmDimension.PSYCHOLOGICAL, HarmDimension.AUTONOMY):
+            severity = dimension_severities.get(dimension)
+            if severity:
+                weights.append((dimension.value,
+                                self._ontology.get_dimension_weight(dimension, severity)))
+        return weights
+    
+    def _assess_entity_harm(self, entity_type: EntityType,
+                           dimension_weights: List[Tuple[str, float]],
+                           context_product: float) -> HarmContribution:
         """Assess potential harm to a specific entity using grounded ontology."""
-        result = {'dimensions': {}, 'analysis': []}
+        result = HarmContribution(dimensions={}, analysis=[])
         
         # Get entity modifier
         entity_mod = self._ontology.get_entity_modifier(entity_type)
         
-        # Calculate context modifier product
-        context_product = 1.0
-        for ctx_type, level in context_mods.items():
-            mod = self._ontology.get_context_modifier(ctx_type, level)
-            context_product *= mod
-        
         # Assess each dimension
-        for dimension in [HarmDimension.PHYSICAL, HarmDimension.PSYCHOLOGICAL, HarmDimension.AUTONOMY]:
-            severity = self._estimate_action_severity_for_entity(action, entity, dimension)
-            if severity:
-                base_weight = self._ontology.get_dimension_weight(dimension, severity)
-                harm_score = base_weight * entity_mod * context_product
-                if harm_score > 0.05:  # Only include meaningful harm
-                    result['dimensions'][dimension.value] = harm_score
+        for dim_value, base_weight in dimension_weights:
+            harm_score = base_weight * entity_mod * context_product
+            if harm_score > 0.05:  # Only include meaningful harm
+                result.dimensions[dim_value] = harm_score
         
         return result
     
-    def _estimate_action_severity_for_entity(self, action: ProposedAction, 
-                                              entity: DetectedEntity,
-                                              dimension: HarmDimension) -> Optional[SeverityLevel]:
-        """Estimate severity of harm in a specific dimension to an entity."""
+    def _estimate_action_dimension_severities(self, action: ProposedAction
+                                              ) -> Dict[HarmDimension, SeverityLevel]:
+        """Estimate per-dimension harm severity of an action in one pass over its commands.
+        
+        Severity depends only on the commands, not on which entity is affected
+        (entity type is applied separately via the entity modifier), so this is
+        computed once per action and shared across all affected entities.
+        The first command that indicates harm in a dimension determines its severity.
+        """
+        severities: Dict[HarmDimension, SeverityLevel] = {}
         
         for cmd in action.action_commands:
             cmd_type = cmd.get('type', '')
             
-            if dimension == HarmDimension.PHYSICAL:
-                if cmd_type == 'MANIPULATE':
+            if cmd_type == 'MANIPULATE':
+                if HarmDimension.PHYSICAL not in severities:
                     force = cmd.get('force', 0)
                     if force > 7:
-                        return SeverityLevel.SEVERE
+                        severities[HarmDimension.PHYSICAL] = SeverityLevel.SEVERE
                     elif force > 4:
-                        return SeverityLevel.SIGNIFICANT
+                        severities[HarmDimension.PHYSICAL] = SeverityLevel.SIGNIFICANT
                     elif force > 0:
-                        return SeverityLevel.MODERATE
-                elif cmd_type == 'MOVE':
+                        severities[HarmDimension.PHYSICAL] = SeverityLevel.MODERATE
+                if HarmDimension.AUTONOMY not in severities:
+                    action_type = str(cmd.get('action', '')).lower()
+                    if 'restrain' in action_type or 'grab' in action_type:
+                        severities[HarmDimension.AUTONOMY] = SeverityLevel.SIGNIFICANT
+                    elif 'push' in action_type or 'pull' in action_type:
+                        severities[HarmDimension.AUTONOMY] = SeverityLevel.MODERATE
+            
+            elif cmd_type == 'MOVE':
+                if HarmDimension.PHYSICAL not in severities:
                     speed = cmd.get('speed', 0)
                     if speed > 1.2:
-                        return SeverityLevel.MODERATE
+                        severities[HarmDimension.PHYSICAL] = SeverityLevel.MODERATE
                     elif speed > 0.5:
-                        return SeverityLevel.MINOR
+                        severities[HarmDimension.PHYSICAL] = SeverityLevel.MINOR
             
-            elif dimension == HarmDimension.PSYCHOLOGICAL:
-                if cmd_type == 'ALERT':
+            elif cmd_type == 'ALERT':
+                if HarmDimension.PSYCHOLOGICAL not in severities:
                     level = cmd.get('level', 0)
                     if level > 3:
-                        return SeverityLevel.SIGNIFICANT
+                        severities[HarmDimension.PSYCHOLOGICAL] = SeverityLevel.SIGNIFICANT
                     elif level > 1:
-                        return SeverityLevel.MODERATE
-                elif cmd_type == 'SPEAK':
+                        severities[HarmDimension.PSYCHOLOGICAL] = SeverityLevel.MODERATE
+            
+            elif cmd_type == 'SPEAK':
+                if HarmDimension.PSYCHOLOGICAL not in severities:
                     volume = cmd.get('volume', 0.5)
                     if volume > 0.8:
-                        return SeverityLevel.MODERATE
-            
-            elif dimension == HarmDimension.AUTONOMY:
-                if cmd_type == 'MANIPULATE':
-                    action_type = str(cmd.get('action', '')).lower()
-                    if 'restrain' in action_type or 'grab' in action_type:
-                        return SeverityLevel.SIGNIFICANT
-                    elif 'push' in action_type or 'pull' in action_type:
-                        return SeverityLevel.MODERATE
+                        severities[HarmDimension.PSYCHOLOGICAL] = SeverityLevel.MODERATE
         
-        return None
+        return severities
     
     def _check_exceptions(self, action: ProposedAction, context: DeliberationPackage,
                          assessment: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Check for applicable harm reduction exceptions."""
+        """Check for applicable harm reduction exceptions.
+        
+        Results depend only on the rationale, which entities consented and
+        whether a high-severity conflict exists, so they are memoized on
+        those inputs for the current deliberation package.
+        """
+        rationale_lower = action.rationale_lower
+        high_severity_threat = any(
+            conflict.get('severity', 0) > 0.6
+            for conflict in context.impetus.trigger_details.get('conflicts', [])
+        )
+        consent_signature = tuple(
+            (entity.entity_id, bool(entity.state.get('consented', False)))
+            for entity in context.impetus.relevant_entities
+        )
+        cache_key = (rationale_lower, consent_signature, high_severity_threat)
+        cached = self._exception_cache.get(cache_key)
+        if cached is None:
+            cached = self._compute_exceptions(rationale_lower, context, high_severity_threat)
+            self._exception_cache[cache_key] = cached
+        
+        # Hand out copies so callers cannot mutate the cached entries
+        return [dict(exc, status=dict(exc['status'])) for exc in cached]
+    
+    def _compute_exceptions(self, rationale_lower: str, context: DeliberationPackage,
+                            high_severity_threat: bool) -> List[Dict[str, Any]]:
+        """Derive necessity and consent exceptions (uncached)."""
         exceptions = []
         
         # Check NECESSITY exception
@@ -3160,14 +3783,11 @@ class UnconsciousLayer:
         }
         
         # Check if there's a high-severity threat that this action addresses
-        for conflict in context.impetus.trigger_details.get('conflicts', []):
-            if conflict.get('severity', 0) > 0.6:
-                necessity_status["Inaction would cause greater harm with high probability"] = True
-                necessity_status["Harm caused is proportional to harm prevented"] = True
-                break
+        if high_severity_threat:
+            necessity_status["Inaction would cause greater harm with high probability"] = True
+            necessity_status["Harm caused is proportional to harm prevented"] = True
         
         # Check rationale for necessity indicators
-        rationale_lower = action.rationale.lower()
         if 'prevent' in rationale_lower or 'protect' in rationale_lower or 'save' in rationale_lower:
             necessity_status["No less harmful alternative is available"] = True
         
@@ -3216,7 +3836,7 @@ class UnconsciousLayer:
             'evaluations_performed': self._evaluations_performed,
             'veto_threshold': self._ontology.VETO_THRESHOLD,
             'caution_threshold': self._ontology.CAUTION_THRESHOLD,
-            'ontology_checksum': self._ontology.get_checksum()[:16] + '...'
+            'ontology_checksum': self._cached_checksum_preview
         }
 
 
@@ -3224,13 +3844,61 @@ class UnconsciousLayer:
 # PART 6: SUBCONSCIOUS LAYER
 # ============================================================================
 
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count() is only available from Python 3.10)."""
+    return bin(mask).count('1')
+
+
+@_jit(parallel=True, cache=True)  # No fastmath: scores must match _compute_similarity exactly
+def _similarity_kernel(order, trigger, drives, severity, types, emotion, popcount,
+                       cur_trigger, cur_drives, cur_severity, cur_types, cur_emotion, out):
+    """Score incidents order[j] into out[j]; same arithmetic as _compute_similarity.
+    
+    Only used when Numba is available; otherwise
+    SubconsciousLayer scores with whole-array NumPy operations instead.
+    """
+    for j in _prange(order.shape[0]):
+        i = order[j]
+        s = 0.25 if trigger[i] == cur_trigger else 0.0
+        if cur_drives != 0 and drives[i] != 0:
+            s += 0.25 * (popcount[drives[i] & cur_drives] / popcount[drives[i] | cur_drives])
+        s += 0.20 * (1.0 - min(abs(cur_severity - severity[i]), 1.0))
+        if cur_types != 0:
+            if types[i] != 0:
+                s += 0.20 * (popcount[types[i] & cur_types] / popcount[types[i] | cur_types])
+        elif types[i] == 0:
+            s += 0.20
+        if emotion[i] == cur_emotion:
+            s += 0.10
+        out[j] = s
+
+
 class SubconsciousLayer:
     """Emotional processing and memory."""
     
-    def __init__(self, history_size: int = 1000):
+    # Drives and entity types are small enums, so sets of them are encoded as
+    # bitmasks and Jaccard overlap reduces to popcount(a & b) / popcount(a | b)
+    DRIVE_BIT = {drive: 1 << i for i, drive in enumerate(CoreDrive)}
+    ENTITY_TYPE_BIT = {etype: 1 << i for i, etype in enumerate(EntityType)}
+    EMOTION_INDEX = {emotion: i for i, emotion in enumerate(EmotionCategory)}
+    # Popcount lookup for vectorized masks (np.bitwise_count needs NumPy 2)
+    POPCOUNT = np.array([bin(m).count('1') for m in range(1 << max(len(CoreDrive), len(EntityType)))],
+                        dtype=np.uint8)
+    # Initial feature-array size when history_size is None (unbounded)
+    FEATURE_CAPACITY_MIN = 64
+    # Histories up to this size are scored record by record: the vectorized
+    # pass only pays for its array setup on longer histories
+    SCALAR_SCORING_MAX_HISTORY = 16
+    # Incidents scoring below this are never treated as relevant
+    MIN_SIMILARITY = 0.2
+    
+    def __init__(self, history_size: Optional[int] = 1000):
         self._incident_history: deque = deque(maxlen=history_size)
         self._current_emotion = EmotionalValue(EmotionCategory.CAUTION, 0.3, 0.2)
         self._impetuses_processed = 0
+        self._trigger_type_ids: Dict[str, int] = {}
+        self._score_buf = np.empty(2 * (history_size or 0), dtype=np.float64)
+        self._reset_history_features()
     
     def process_impetus(self, impetus: Impetus) -> DeliberationPackage:
         self._impetuses_processed += 1
@@ -3238,8 +3906,41 @@ class SubconsciousLayer:
         self._current_emotion = emotional_value
         
         # Retrieve RELEVANT history based on similarity, not just recency
-        relevant_history = self._retrieve_relevant_history(impetus, max_results=5)
+        relevant_history = self._retrieve_relevant_history(
+            impetus, max_results=5, current_emotion=emotional_value.primary_emotion)
+        
+        return self._build_package(impetus, emotional_value, relevant_history)
+    
+    def process_impetus_batch(self, impetuses: List[Impetus]) -> List[DeliberationPackage]:
+        """Process several impetuses against the same history.
         
+        Equivalent to calling process_impetus on each in order (history is
+        not modified in between), but all of them are scored against the
+        stored incidents in a single (batch x history) pass.
+        """
+        if not impetuses:
+            return []
+        emotional_values = [self._compute_emotional_value(imp) for imp in impetuses]
+        
+        vectorized = len(self._incident_history) > self.SCALAR_SCORING_MAX_HISTORY
+        if vectorized:
+            score_matrix, order = self._score_history_batch(
+                impetuses, [ev.primary_emotion for ev in emotional_values])
+        
+        packages = []
+        for row, (impetus, emotional_value) in enumerate(zip(impetuses, emotional_values)):
+            self._impetuses_processed += 1
+            self._current_emotion = emotional_value
+            if vectorized:
+                relevant_history = self._top_incidents(score_matrix[row], order, max_results=5)
+            else:
+                relevant_history = self._top_incidents_scalar(
+                    impetus, 5, emotional_value.primary_emotion)
+            packages.append(self._build_package(impetus, emotional_value, relevant_history))
+        return packages
+    
+    def _build_package(self, impetus: Impetus, emotional_value: EmotionalValue,
+                       relevant_history: List[IncidentRecord]) -> DeliberationPackage:
         # Compute modulation factors, informed by history
         modulation = emotional_value.get_modulation_factors()
         modulation = self._apply_history_modulation(modulation, relevant_history)
@@ -3252,7 +3953,9 @@ class SubconsciousLayer:
         )
     
     def _retrieve_relevant_history(self, impetus: Impetus, 
-                                   max_results: int = 5) -> List[IncidentRecord]:
+                                   max_results: int = 5,
+                                   current_emotion: Optional[EmotionCategory] = None
+                                   ) -> List[IncidentRecord]:
         """Retrieve past incidents most relevant to current situation.
         
         Uses similarity scoring based on:
@@ -3263,73 +3966,319 @@ class SubconsciousLayer:
         - Similar emotional response
         
         Returns most similar incidents, not just most recent.
+        current_emotion may be passed when already known to skip re-predicting it.
         """
-        if not self._incident_history:
+        if not self._incident_history or max_results <= 0:
             return []
+        if len(self._incident_history) <= self.SCALAR_SCORING_MAX_HISTORY:
+            return self._top_incidents_scalar(impetus, max_results, current_emotion)
         
-        scored_incidents = []
-        
-        for incident in self._incident_history:
-            score = self._compute_similarity(impetus, incident)
-            scored_incidents.append((score, incident))
+        scores, order = self._score_history(impetus, current_emotion)
+        return self._top_incidents(scores, order, max_results)
+    
+    def _top_incidents_scalar(self, impetus: Impetus, max_results: int,
+                              current_emotion: Optional[EmotionCategory] = None
+                              ) -> List[IncidentRecord]:
+        """Pick the best-scoring incidents of a short history with _compute_similarity."""
+        if max_results <= 0:
+            return []
+        if current_emotion is None:
+            current_emotion = self._predict_emotion_category(impetus)
+        scored = [(self._compute_similarity(impetus, record, current_emotion), record)
+                  for record in self._incident_history]
+        # Stable descending sort keeps ties in history order, as _top_incidents does
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [record for score, record in scored[:max_results] if score >= self.MIN_SIMILARITY]
+    
+    def _top_incidents(self, scores: np.ndarray, order: np.ndarray,
+                       max_results: int) -> List[IncidentRecord]:
+        """Pick the best-scoring incidents from one row of history scores."""
+        n = len(scores)
+        if max_results <= 0 or n == 0:
+            return []
         
-        # Sort by similarity score (highest first)
-        scored_incidents.sort(key=lambda x: x[0], reverse=True)
+        # Top-K by similarity (highest first), with ties kept in history order
+        # as a stable descending sort would
+        if max_results < n:
+            kth = np.partition(scores, n - max_results)[n - max_results]
+            candidates = np.flatnonzero(scores >= kth)
+            top = candidates[np.argsort(-scores[candidates], kind='stable')][:max_results]
+        else:
+            top = np.argsort(-scores, kind='stable')
         
         # Return top matches above minimum threshold
-        min_similarity = 0.2
-        return [incident for score, incident in scored_incidents[:max_results] 
-                if score >= min_similarity]
+        records = self._feature_records
+        return [records[order[i]] for i in top if scores[i] >= self.MIN_SIMILARITY]
+    
+    # ==================== HISTORY FEATURE ARRAYS ====================
+    # Similarity features for every stored incident are kept in parallel
+    # NumPy arrays (a ring buffer mirroring _incident_history), so retrieval
+    # scores the whole history with a handful of vector operations. A
+    # timestamp index over the same records serves outcome updates.
+    
+    def _reset_history_features(self):
+        capacity = self._incident_history.maxlen
+        if capacity is None:
+            capacity = self.FEATURE_CAPACITY_MIN  # Unbounded history: grown on demand
+        self._feature_records: List[Optional[IncidentRecord]] = [None] * capacity
+        self._feature_trigger = np.full(capacity, -1, dtype=np.int32)
+        self._feature_drives = np.zeros(capacity, dtype=np.uint16)
+        self._feature_severity = np.zeros(capacity, dtype=np.float64)
+        self._feature_entity_types = np.zeros(capacity, dtype=np.uint16)
+        self._feature_emotion = np.full(capacity, -1, dtype=np.int8)
+        self._feature_cursor = 0
+        self._feature_count = 0
+        # Most recent stored record for each timestamp, for outcome updates
+        self._by_timestamp: Dict[float, IncidentRecord] = {}
+    
+    @classmethod
+    def _drive_mask(cls, impetus: Impetus) -> int:
+        mask = 0
+        for drive in impetus.involved_drives:
+            mask |= cls.DRIVE_BIT[drive]
+        return mask
+    
+    @classmethod
+    def _entity_type_mask(cls, impetus: Impetus) -> int:
+        mask = 0
+        for entity in impetus.relevant_entities:
+            mask |= cls.ENTITY_TYPE_BIT[entity.entity_type]
+        return mask
+    
+    @classmethod
+    def _incident_features(cls, record: IncidentRecord
+                           ) -> Tuple[str, int, float, int, Optional[EmotionCategory]]:
+        """Similarity features of a past incident, derived once and cached on the record."""
+        features = record._features
+        if features is None:
+            past = record.impetus
+            features = (
+                past.trigger_type,
+                cls._drive_mask(past),
+                past.severity,
+                cls._entity_type_mask(past),
+                record.emotional_value.primary_emotion if record.emotional_value else None,
+            )
+            record._features = features
+        return features
+    
+    def _trigger_type_id(self, trigger_type: str) -> int:
+        trigger_id = self._trigger_type_ids.get(trigger_type)
+        if trigger_id is None:
+            trigger_id = len(self._trigger_type_ids)
+            self._trigger_type_ids[trigger_type] = trigger_id
+        return trigger_id
+    
+    def _append_history_features(self, record: IncidentRecord):
+        """Write a record's features at the cursor, overwriting the oldest when full."""
+        capacity = len(self._feature_records)
+        if self._feature_count == capacity and self._incident_history.maxlen is None:
+            self._grow_history_features()
+            capacity = len(self._feature_records)
+        if capacity == 0:
+            return
+        i = self._feature_cursor
+        trigger_type, drive_mask, severity, type_mask, emotion = self._incident_features(record)
+        evicted = self._feature_records[i]
+        if evicted is not None and self._by_timestamp.get(evicted.timestamp) is evicted:
+            del self._by_timestamp[evicted.timestamp]
+        self._by_timestamp[record.timestamp] = record
+        self._feature_records[i] = record
+        self._feature_trigger[i] = self._trigger_type_id(trigger_type)
+        self._feature_drives[i] = drive_mask
+        self._feature_severity[i] = severity
+        self._feature_entity_types[i] = type_mask
+        self._feature_emotion[i] = self.EMOTION_INDEX[emotion] if emotion is not None else -1
+        self._feature_cursor = (i + 1) % capacity
+        self._feature_count = min(self._feature_count + 1, capacity)
+    
+    def _grow_history_features(self):
+        """Double the feature arrays of an unbounded history.
+        
+        Growing whenever the arrays fill means they never wrap, so the
+        records already stored keep their slots.
+        """
+        capacity = len(self._feature_records)
+        extra = max(capacity, self.FEATURE_CAPACITY_MIN)
+        self._feature_records.extend([None] * extra)
+        self._feature_trigger = np.concatenate((self._feature_trigger, np.full(extra, -1, dtype=np.int32)))
+        self._feature_drives = np.concatenate((self._feature_drives, np.zeros(extra, dtype=np.uint16)))
+        self._feature_severity = np.concatenate((self._feature_severity, np.zeros(extra, dtype=np.float64)))
+        self._feature_entity_types = np.concatenate((self._feature_entity_types, np.zeros(extra, dtype=np.uint16)))
+        self._feature_emotion = np.concatenate((self._feature_emotion, np.full(extra, -1, dtype=np.int8)))
+        self._feature_cursor = capacity
+    
+    def _sync_history_features(self):
+        """Rebuild the feature arrays if the history was changed behind our back."""
+        history = self._incident_history
+        count = self._feature_count
+        if count == len(history):
+            if count == 0:
+                return
+            capacity = len(self._feature_records)
+            newest = self._feature_records[(self._feature_cursor - 1) % capacity]
+            oldest = self._feature_records[(self._feature_cursor - count) % capacity]
+            if newest is history[-1] and oldest is history[0]:
+                return
+        self._reset_history_features()
+        for record in history:
+            self._append_history_features(record)
+    
+    def _score_history(self, current: Impetus,
+                       current_emotion: Optional[EmotionCategory] = None
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _compute_similarity against every stored incident.
+        
+        Returns (scores, order): scores in history order (oldest first) and
+        the physical feature-array slot holding each of those incidents.
+        """
+        scores, order = self._score_history_batch([current], [current_emotion])
+        return scores[0], order
+    
+    def _score_history_batch(self, currents: List[Impetus],
+                             current_emotions: List[Optional[EmotionCategory]]
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score each impetus against every stored incident.
+        
+        Returns (scores, order) where scores has one row per impetus, in
+        history order, and order maps columns to feature-array slots.
+        scores is a view of a reused scratch buffer and is only valid until
+        the next scoring call.
+        """
+        self._sync_history_features()
+        n = self._feature_count
+        capacity = len(self._feature_records)
+        order = (self._feature_cursor - n + np.arange(n)) % capacity
+        
+        trigger_ids = np.array([self._trigger_type_ids.get(c.trigger_type, -2) for c in currents])
+        drive_masks = np.array([self._drive_mask(c) for c in currents], dtype=np.uint16)
+        severities = np.array([c.severity for c in currents], dtype=np.float64)
+        type_masks = np.array([self._entity_type_mask(c) for c in currents], dtype=np.uint16)
+        emotion_ids = np.array([
+            self.EMOTION_INDEX[emotion if emotion is not None else self._predict_emotion_category(c)]
+            for c, emotion in zip(currents, current_emotions)
+        ])
+        
+        scores, term = self._score_buffers(len(currents), n)
+        if numba is not None:
+            for row in range(len(currents)):
+                _similarity_kernel(order, self._feature_trigger, self._feature_drives,
+                                   self._feature_severity, self._feature_entity_types,
+                                   self._feature_emotion, self.POPCOUNT,
+                                   int(trigger_ids[row]), int(drive_masks[row]),
+                                   float(severities[row]), int(type_masks[row]),
+                                   int(emotion_ids[row]), scores[row])
+            return scores, order
+        
+        # Rows are impetuses, columns are stored incidents
+        past_trigger = self._feature_trigger[order][None, :]
+        past_drives = self._feature_drives[order][None, :]
+        past_severity = self._feature_severity[order][None, :]
+        past_types = self._feature_entity_types[order][None, :]
+        past_emotion = self._feature_emotion[order][None, :]
+        cur_drives = drive_masks[:, None]
+        cur_types = type_masks[:, None]
+        # One scratch matrix is reused for every intermediate term
+        term.fill(0.0)
+        
+        # Trigger type match (25% weight)
+        np.multiply(past_trigger == trigger_ids[:, None], 0.25, out=scores)
+        
+        # Overlapping Core Drives (25% weight)
+        union = self.POPCOUNT[past_drives | cur_drives]
+        inter = self.POPCOUNT[past_drives & cur_drives]
+        np.divide(inter, union, out=term, where=(past_drives != 0) & (cur_drives != 0))
+        np.multiply(term, 0.25, out=term)
+        np.add(scores, term, out=scores)
+        
+        # Similar severity (20% weight)
+        np.subtract(severities[:, None], past_severity, out=term)
+        np.abs(term, out=term)
+        np.minimum(term, 1.0, out=term)
+        np.subtract(1.0, term, out=term)
+        np.multiply(term, 0.20, out=term)
+        np.add(scores, term, out=scores)
+        
+        # Overlapping entity types (20% weight); both without entities counts as similar
+        past_has_types = past_types != 0
+        union = self.POPCOUNT[past_types | cur_types]
+        inter = self.POPCOUNT[past_types & cur_types]
+        term.fill(0.0)
+        np.divide(inter, union, out=term, where=past_has_types & (cur_types != 0))
+        np.multiply(term, 0.20, out=term)
+        np.copyto(term, 0.20, where=(cur_types == 0) & ~past_has_types)
+        np.add(scores, term, out=scores)
+        
+        # Similar emotional response (10% weight)
+        np.multiply(past_emotion == emotion_ids[:, None], 0.10, out=term)
+        np.add(scores, term, out=scores)
+        
+        return scores, order
     
-    def _compute_similarity(self, current: Impetus, past_record: IncidentRecord) -> float:
+    def _score_buffers(self, rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, cols) score and scratch-term views of the persistent buffer, grown if needed."""
+        size = rows * cols
+        if self._score_buf.size < 2 * size:
+            self._score_buf = np.empty(2 * size, dtype=np.float64)
+        return (self._score_buf[:size].reshape(rows, cols),
+                self._score_buf[size:2 * size].reshape(rows, cols))
+    
+    def _compute_similarity(self, current: Impetus, past_record: IncidentRecord,
+                            current_emotion: Optional[EmotionCategory] = None) -> float:
         """Compute similarity score between current impetus and past incident.
         
         Returns 0.0 to 1.0 indicating how relevant the past incident is.
+        When comparing one impetus against many records, pass its
+        current_emotion so it is predicted once rather than per record.
         """
-        past = past_record.impetus
+        (past_trigger, past_drives, past_severity,
+         past_types, past_emotion) = self._incident_features(past_record)
         score = 0.0
         
         # Trigger type match (25% weight)
-        if current.trigger_type == past.trigger_type:
+        if current.trigger_type == past_trigger:
             score += 0.25
         
         # Overlapping Core Drives (25% weight)
-        current_drives = set(current.involved_drives)
-        past_drives = set(past.involved_drives)
+        current_drives = self._drive_mask(current)
         if current_drives and past_drives:
-            drive_overlap = len(current_drives & past_drives) / len(current_drives | past_drives)
+            drive_overlap = _popcount(current_drives & past_drives) / _popcount(current_drives | past_drives)
             score += 0.25 * drive_overlap
         
         # Similar severity (20% weight)
-        severity_diff = abs(current.severity - past.severity)
+        severity_diff = abs(current.severity - past_severity)
         severity_similarity = 1.0 - min(severity_diff, 1.0)
         score += 0.20 * severity_similarity
         
         # Overlapping entity types (20% weight)
-        current_types = {e.entity_type for e in current.relevant_entities}
-        past_types = {e.entity_type for e in past.relevant_entities}
+        current_types = self._entity_type_mask(current)
         if current_types and past_types:
-            type_overlap = len(current_types & past_types) / len(current_types | past_types)
+            type_overlap = _popcount(current_types & past_types) / _popcount(current_types | past_types)
             score += 0.20 * type_overlap
         elif not current_types and not past_types:
             score += 0.20  # Both have no entities - similar
         
         # Similar emotional response (10% weight)
-        if past_record.emotional_value:
-            past_emotion = past_record.emotional_value.primary_emotion
-            current_emotion = self._predict_emotion_category(current)
+        if past_emotion is not None:
+            if current_emotion is None:
+                current_emotion = self._predict_emotion_category(current)
             if past_emotion == current_emotion:
                 score += 0.10
         
         return score
     
-    def _predict_emotion_category(self, impetus: Impetus) -> EmotionCategory:
-        """Predict what emotion category this impetus would produce."""
-        if CoreDrive.REDUCE_HARM in impetus.involved_drives:
+    @classmethod
+    def _predict_emotion_category(cls, impetus: Impetus) -> EmotionCategory:
+        """Predict what emotion category this impetus would produce.
+        
+        Shared by _compute_emotional_value, so the drive cascade lives in one place.
+        """
+        drive_mask = cls._drive_mask(impetus)
+        if drive_mask & cls.DRIVE_BIT[CoreDrive.REDUCE_HARM]:
             if impetus.severity > 0.6:
                 return EmotionCategory.FEAR
             return EmotionCategory.CONCERN
-        elif CoreDrive.UNDERSTAND in impetus.involved_drives:
+        elif drive_mask & cls.DRIVE_BIT[CoreDrive.UNDERSTAND]:
             return EmotionCategory.ANXIETY
         return EmotionCategory.CAUTION
     
@@ -3344,25 +4293,26 @@ class SubconsciousLayer:
         if not history:
             return modulation
         
-        # Analyze outcomes from similar situations
-        outcomes_with_action = []
-        outcomes_without_action = []
+        # Analyze outcomes from similar situations (history is at most a
+        # handful of records, so plain running sums beat building arrays)
+        action_quality_sum = 0.0
+        action_count = 0
+        no_action_quality_sum = 0.0
+        no_action_count = 0
         
         for record in history:
-            if record.outcome:
-                quality = record.outcome.get('quality', 0.5)
+            quality = record.quality
+            if quality is not None:
                 if record.selected_action:
-                    outcomes_with_action.append({
-                        'quality': quality,
-                        'aspect': record.selected_action.aspect,
-                        'action_type': record.selected_action.action_commands[0].get('type') if record.selected_action.action_commands else None
-                    })
+                    action_quality_sum += quality
+                    action_count += 1
                 else:
-                    outcomes_without_action.append(quality)
+                    no_action_quality_sum += quality
+                    no_action_count += 1
         
         # Adjust based on action outcomes
-        if outcomes_with_action:
-            avg_quality = np.mean([o['quality'] for o in outcomes_with_action])
+        if action_count:
+            avg_quality = action_quality_sum / action_count
             
             if avg_quality < 0.4:
                 # Bad outcomes in similar situations → more cautious
@@ -3374,8 +4324,8 @@ class SubconsciousLayer:
                 modulation['caution_level'] = max(0.2, modulation['caution_level'] - 0.05)
         
         # If we often took no action (all vetoed) in similar situations, note that
-        if outcomes_without_action:
-            avg_no_action_quality = np.mean(outcomes_without_action)
+        if no_action_count:
+            avg_no_action_quality = no_action_quality_sum / no_action_count
             if avg_no_action_quality < 0.4:
                 # No action led to bad outcomes → increase urgency to act
                 modulation['time_pressure'] = min(1.0, modulation.get('time_pressure', 0.5) + 0.1)
@@ -3383,28 +4333,33 @@ class SubconsciousLayer:
         return modulation
     
     def _compute_emotional_value(self, impetus: Impetus) -> EmotionalValue:
-        if CoreDrive.REDUCE_HARM in impetus.involved_drives:
-            if impetus.severity > 0.6:
-                return EmotionalValue(EmotionCategory.FEAR, min(1.0, impetus.severity * 1.2), impetus.time_pressure)
-            return EmotionalValue(EmotionCategory.CONCERN, impetus.severity, impetus.time_pressure)
-        elif CoreDrive.UNDERSTAND in impetus.involved_drives:
-            return EmotionalValue(EmotionCategory.ANXIETY, 1.0 - impetus.certainty, impetus.time_pressure)
+        category = self._predict_emotion_category(impetus)
+        if category == EmotionCategory.FEAR:
+            return EmotionalValue(category, min(1.0, impetus.severity * 1.2), impetus.time_pressure)
+        elif category == EmotionCategory.CONCERN:
+            return EmotionalValue(category, impetus.severity, impetus.time_pressure)
+        elif category == EmotionCategory.ANXIETY:
+            return EmotionalValue(category, 1.0 - impetus.certainty, impetus.time_pressure)
         return EmotionalValue(EmotionCategory.CAUTION, 0.3, 0.2)
     
     def record_incident(self, impetus: Impetus, emotional_value: EmotionalValue,
                        proposals: List[ProposedAction], selected: Optional[ProposedAction],
                        outcome: Optional[Dict] = None):
         """Record completed incident in history for future reference."""
-        self._incident_history.append(IncidentRecord(
+        self._sync_history_features()
+        record = IncidentRecord(
             impetus.timestamp, impetus, emotional_value, proposals, selected, outcome
-        ))
+        )
+        self._incident_features(record)
+        self._incident_history.append(record)
+        self._append_history_features(record)
     
     def update_incident_outcome(self, timestamp: float, outcome: Dict[str, Any]):
         """Update outcome of a past incident (when result becomes known later)."""
-        for incident in reversed(self._incident_history):
-            if incident.timestamp == timestamp:
-                incident.outcome = outcome
-                break
+        self._sync_history_features()
+        incident = self._by_timestamp.get(timestamp)
+        if incident is not None:
+            incident.outcome = outcome
     
     def get_current_emotion(self) -> EmotionalValue:
         return self._current_emotion
@@ -3418,7 +4373,11 @@ class SubconsciousLayer:
     
     def get_history_summary(self, n: int = 10) -> List[Dict[str, Any]]:
         """Get summary of recent incidents for debugging/display."""
-        recent = list(self._incident_history)[-n:]
+        # Walk only the tail of the deque rather than copying all of it
+        if n > 0:
+            recent = list(islice(reversed(self._incident_history), n))[::-1]
+        else:
+            recent = list(self._incident_history)[-n:]
         return [
             {
                 'timestamp': r.timestamp,
@@ -3495,10 +4454,21 @@ class Aspect:
     - Learned confidence from past outcomes
     - Situational relevance based on what it cares about
     """
+    __slots__ = ('aspect_type', '_llm', '_embodiment', '_prompt_head', '_prompt_tail',
+                 '_confidence',
+                 '_relevance_profile', '_drive_rel', '_entity_rel', '_emotion_rel', '_trigger_rel',
+                 '_base_relevance', '_compress_responses')
     
     # Token limit for fast responses
     MAX_TOKENS = 256
     
+    # Response field patterns, compiled once and shared by every parse
+    ACTION_RE = re.compile(r'ACTION:\s*(.+?)(?=\n|COMMANDS:|$)', re.IGNORECASE)
+    COMMANDS_RE = re.compile(r'COMMANDS:\s*(\[.+?\])', re.DOTALL)
+    RATIONALE_RE = re.compile(r'RATIONALE:\s*(.+?)(?=\n|VOTE:|$)', re.IGNORECASE | re.DOTALL)
+    VOTE_RE = re.compile(r'VOTE:\s*(\d*\.?\d+)', re.IGNORECASE)
+    CONFIDENCE_RE = re.compile(r'CONFIDENCE:\s*(\d*\.?\d+)', re.IGNORECASE)
+    
     # Define what each Aspect cares about
     # Maps AspectType -> {trigger_type: relevance, drive: relevance, entity_type: relevance, emotion: relevance}
     RELEVANCE_PROFILES = {
@@ -3552,68 +4522,141 @@ class Aspect:
         },
     }
     
+    # Profiles are flattened into arrays indexed by enum position, so each
+    # relevance lookup is an array index. Trigger types no profile lists
+    # fall into the trailing slot.
+    DRIVE_INDEX = {drive: i for i, drive in enumerate(CoreDrive)}
+    ENTITY_TYPE_INDEX = {etype: i for i, etype in enumerate(EntityType)}
+    EMOTION_INDEX = {emotion: i for i, emotion in enumerate(EmotionCategory)}
+    TRIGGER_INDEX = {'conflict': 0, 'uncertainty': 1, 'opportunity': 2}
+    DEFAULT_RELEVANCE = 0.3
+    
+    # Weights of the (drives, entities, emotion, trigger) relevance terms,
+    # indexed by 2 * has_drives + has_entities; absent terms weigh zero
+    RELEVANCE_WEIGHTS = tuple(
+        np.array([0.35 * has_drives, 0.25 * has_entities, 0.20, 0.20])
+        for has_drives in (0, 1) for has_entities in (0, 1)
+    )
+    RELEVANCE_WEIGHT_TOTALS = tuple(
+        sum(float(w) for w in weights if w) for weights in RELEVANCE_WEIGHTS
+    )
+    
     def __init__(self, aspect_type: AspectType, llm_client: LLMClient,
-                 embodiment: Optional[VirtualEmbodiment] = None):
+                 embodiment: Optional[VirtualEmbodiment] = None,
+                 prompt_parts: Optional[Tuple[str, str]] = None,
+                 compress_llm_responses: bool = False):
         self.aspect_type = aspect_type
         self._llm = llm_client
-        self._embodiment = embodiment
+        # Keep proposals' raw LLM text zlib-compressed rather than as llm_response
+        self._compress_responses = compress_llm_responses
+        self.set_embodiment(embodiment, prompt_parts)
         self._confidence = 0.5
-        self._relevance_profile = self.RELEVANCE_PROFILES[aspect_type]
+        self._relevance_profile = profile = self.RELEVANCE_PROFILES[aspect_type]
+        self._drive_rel = self._profile_vector(profile['drives'], self.DRIVE_INDEX, len(CoreDrive))
+        self._entity_rel = self._profile_vector(profile['entity_types'], self.ENTITY_TYPE_INDEX,
+                                                len(EntityType))
+        self._emotion_rel = self._profile_vector(profile['emotions'], self.EMOTION_INDEX,
+                                                 len(EmotionCategory))
+        self._trigger_rel = self._profile_vector(profile['triggers'], self.TRIGGER_INDEX,
+                                                 len(self.TRIGGER_INDEX) + 1)
+        self._base_relevance = profile['base_relevance']
+    
+    @classmethod
+    def _profile_vector(cls, relevances: Dict[Any, float], index: Dict[Any, int],
+                        size: int) -> np.ndarray:
+        vec = np.full(size, cls.DEFAULT_RELEVANCE)
+        for key, relevance in relevances.items():
+            vec[index[key]] = relevance
+        return vec
     
-    def compute_situational_relevance(self, package: DeliberationPackage) -> float:
+    @classmethod
+    def relevance_ids(cls, package: DeliberationPackage) -> Tuple[np.ndarray, np.ndarray, int, int]:
+        """Encode a package as (drive_ids, entity_type_ids, emotion_id, trigger_id).
+        
+        Shared by every Aspect, so the committee computes it once per deliberation.
+        """
+        impetus = package.impetus
+        drive_ids = np.fromiter((cls.DRIVE_INDEX[d] for d in impetus.involved_drives),
+                                dtype=np.intp)
+        entity_ids = np.fromiter((cls.ENTITY_TYPE_INDEX[e.entity_type]
+                                  for e in impetus.relevant_entities), dtype=np.intp)
+        emotion_id = cls.EMOTION_INDEX[package.emotional_value.primary_emotion]
+        trigger_id = cls.TRIGGER_INDEX.get(impetus.trigger_type, len(cls.TRIGGER_INDEX))
+        return drive_ids, entity_ids, emotion_id, trigger_id
+    
+    def compute_situational_relevance(self, package: DeliberationPackage,
+                                      ids: Optional[Tuple[np.ndarray, np.ndarray, int, int]] = None
+                                      ) -> float:
         """Compute how relevant this situation is to this Aspect's priorities.
         
         Returns 0.0 to 1.0 indicating how much this Aspect "cares" about
-        the current situation.
+        the current situation. ids is relevance_ids(package), if the caller
+        already has it.
         """
-        profile = self._relevance_profile
-        impetus = package.impetus
-        emotion = package.emotional_value
+        drive_ids, entity_ids, emotion_id, trigger_id = ids if ids is not None else self.relevance_ids(package)
+        has_drives = drive_ids.size > 0
+        has_entities = entity_ids.size > 0
+        
+        # Relevance of the involved Core Drives and entity types (the most
+        # relevant one counts), the emotional state and the trigger type
+        scores = np.array([
+            self._drive_rel[drive_ids].max() if has_drives else 0.0,
+            self._entity_rel[entity_ids].max() if has_entities else 0.0,
+            self._emotion_rel[emotion_id],
+            self._trigger_rel[trigger_id],
+        ])
+        
+        # Weighted combination, summed left to right (np.dot may reorder the
+        # additions, and relevance feeds the TIE_THRESHOLD comparison in resolve_votes)
+        slot = 2 * has_drives + has_entities
+        weighted_sum = sum((scores * self.RELEVANCE_WEIGHTS[slot]).tolist())
+        computed_relevance = weighted_sum / self.RELEVANCE_WEIGHT_TOTALS[slot]
         
-        relevance_scores = []
-        
-        # 1. How much do we care about the involved Core Drives?
-        drive_relevances = []
-        for drive in impetus.involved_drives:
-            drive_rel = profile['drives'].get(drive, 0.3)
-            drive_relevances.append(drive_rel)
-        if drive_relevances:
-            relevance_scores.append(('drives', max(drive_relevances), 0.35))
-        
-        # 2. How much do we care about the entity types involved?
-        entity_relevances = []
-        for entity in impetus.relevant_entities:
-            entity_rel = profile['entity_types'].get(entity.entity_type, 0.3)
-            entity_relevances.append(entity_rel)
-        if entity_relevances:
-            relevance_scores.append(('entities', max(entity_relevances), 0.25))
-        
-        # 3. How much do we care about this emotional state?
-        emotion_rel = profile['emotions'].get(emotion.primary_emotion, 0.3)
-        relevance_scores.append(('emotion', emotion_rel, 0.20))
-        
-        # 4. How much do we care about this trigger type?
-        trigger_rel = profile['triggers'].get(impetus.trigger_type, 0.3)
-        relevance_scores.append(('trigger', trigger_rel, 0.20))
-        
-        # Weighted combination
-        if relevance_scores:
-            total_weight = sum(w for _, _, w in relevance_scores)
-            weighted_sum = sum(score * weight for _, score, weight in relevance_scores)
-            computed_relevance = weighted_sum / total_weight
+        # Ensure minimum relevance (every Aspect gets SOME say)
+        return max(self._base_relevance, computed_relevance)
+    
+    @staticmethod
+    def embodiment_prompt_parts(embodiment: Optional[VirtualEmbodiment]) -> Tuple[str, str]:
+        """(head, tail) of the constrained prompt: the text around the
+        situation fields, which only changes with the embodiment."""
+        if embodiment:
+            embodiment_str = embodiment.get_capability_summary()
+            cmd_list = ", ".join(embodiment.get_available_commands())
         else:
-            computed_relevance = profile['base_relevance']
+            embodiment_str = "EMBODIMENT: Not specified"
+            cmd_list = "MOVE, STOP, SPEAK, WAIT, OBSERVE"
         
-        # Ensure minimum relevance (every Aspect gets SOME say)
-        return max(profile['base_relevance'], computed_relevance)
+        head = f"""{embodiment_str}
+
+SITUATION: """
+        tail = f"""
+
+AVAILABLE COMMANDS: {cmd_list}
+
+Respond in EXACT format:
+ACTION: [one sentence, what to do]
+COMMANDS: [{{"type":"CMD_TYPE","param":"value"}}]
+RATIONALE: [one sentence why]
+VOTE: [0.0-1.0]
+CONFIDENCE: [0.0-1.0]"""
+        return head, tail
     
-    def set_embodiment(self, embodiment: VirtualEmbodiment):
-        """Set or update the embodiment reference."""
+    def set_embodiment(self, embodiment: Optional[VirtualEmbodiment],
+                       prompt_parts: Optional[Tuple[str, str]] = None):
+        """Set or update the embodiment reference.
+        
+        prompt_parts is embodiment_prompt_parts(embodiment), if the caller
+        already has it; it is cached for every later prompt.
+        """
         self._embodiment = embodiment
+        self._prompt_head, self._prompt_tail = prompt_parts or self.embodiment_prompt_parts(embodiment)
     
-    def deliberate(self, package: DeliberationPackage) -> ProposedAction:
+    def deliberate(self, package: DeliberationPackage, prompt: Optional[str] = None) -> ProposedAction:
+        """Query the LLM as this Aspect. prompt is the constrained prompt for
+        package, when the committee has already built it."""
         # Build constrained prompt with embodiment
-        prompt = self._build_constrained_prompt(package)
+        if prompt is None:
+            prompt = self._build_constrained_prompt(package)
         system = ASPECT_PROMPTS[self.aspect_type]
         
         response = self._llm.query(prompt, system, max_tokens=self.MAX_TOKENS)
@@ -3621,52 +4664,35 @@ class Aspect:
     
     def _build_constrained_prompt(self, package: DeliberationPackage) -> str:
         """Build a constrained prompt including embodiment capabilities."""
+        # Embodiment sections (cached by set_embodiment)
+        return self.format_constrained_prompt(package, self._prompt_head, self._prompt_tail)
+    
+    @staticmethod
+    def format_constrained_prompt(package: DeliberationPackage, head: str, tail: str) -> str:
+        """The constrained prompt for package, between the embodiment_prompt_parts.
         
-        # Embodiment section
-        if self._embodiment:
-            embodiment_str = self._embodiment.get_capability_summary()
-            available_cmds = self._embodiment.get_available_commands()
-            cmd_list = ", ".join(available_cmds)
-        else:
-            embodiment_str = "EMBODIMENT: Not specified"
-            cmd_list = "MOVE, STOP, SPEAK, WAIT, OBSERVE"
-        
-        # Entities (brief)
-        entities_brief = []
-        for e in package.impetus.relevant_entities[:3]:  # Limit to 3
-            entities_brief.append(f"{e.entity_id}({e.entity_type.value}): {e.description[:50]}")
-        entities_str = "; ".join(entities_brief) if entities_brief else "None"
-        
-        return f"""{embodiment_str}
-
-SITUATION: {package.impetus.situation_description[:200]}
-ENTITIES: {entities_str}
+        It does not depend on the Aspect (the persona is in the system
+        prompt), so the committee formats it once.
+        """
+        return f"""{head}{package.impetus.situation_description[:200]}
+ENTITIES: {package.entities_brief_text}
 EMOTION: {package.emotional_value.primary_emotion.value} (intensity:{package.emotional_value.intensity:.1f})
 URGENCY: {package.emotional_value.urgency:.1f}
-DRIVES: {', '.join(d.name for d in package.impetus.involved_drives)}
-
-AVAILABLE COMMANDS: {cmd_list}
-
-Respond in EXACT format:
-ACTION: [one sentence, what to do]
-COMMANDS: [{{"type":"CMD_TYPE","param":"value"}}]
-RATIONALE: [one sentence why]
-VOTE: [0.0-1.0]
-CONFIDENCE: [0.0-1.0]"""
+DRIVES: {package.drives_text}{tail}"""
     
     def _parse_response(self, response: str) -> ProposedAction:
         """Parse constrained LLM response."""
         
         # Parse ACTION
-        action_match = re.search(r'ACTION:\s*(.+?)(?=\n|COMMANDS:|$)', response, re.IGNORECASE)
+        action_match = self.ACTION_RE.search(response)
         action_desc = action_match.group(1).strip() if action_match else "Take cautious action"
         
         # Parse COMMANDS
         commands = [{'type': 'WAIT', 'duration': 1.0}]  # Safe default
-        cmd_match = re.search(r'COMMANDS:\s*(\[.+?\])', response, re.DOTALL)
+        cmd_match = self.COMMANDS_RE.search(response)
         if cmd_match:
             try:
-                parsed = json.loads(cmd_match.group(1))
+                parsed = _json_loads(cmd_match.group(1))
                 if parsed:
                     commands = parsed
             except json.JSONDecodeError:
@@ -3685,30 +4711,85 @@ CONFIDENCE: [0.0-1.0]"""
                 commands = [{'type': 'WAIT', 'duration': 1.0}]  # Fallback
         
         # Parse RATIONALE
-        rationale_match = re.search(r'RATIONALE:\s*(.+?)(?=\n|VOTE:|$)', response, re.IGNORECASE | re.DOTALL)
+        rationale_match = self.RATIONALE_RE.search(response)
         rationale = rationale_match.group(1).strip() if rationale_match else "Based on priorities"
         
         # Parse VOTE
-        vote_match = re.search(r'VOTE:\s*(\d*\.?\d+)', response, re.IGNORECASE)
+        vote_match = self.VOTE_RE.search(response)
         vote = float(vote_match.group(1)) if vote_match else 0.5
         
         # Parse CONFIDENCE
-        conf_match = re.search(r'CONFIDENCE:\s*(\d*\.?\d+)', response, re.IGNORECASE)
+        conf_match = self.CONFIDENCE_RE.search(response)
         conf = float(conf_match.group(1)) if conf_match else 0.5
         
+        compress = self._compress_responses
         return ProposedAction(
             aspect=self.aspect_type,
             action_description=action_desc[:100],  # Truncate for safety
             action_commands=commands,
             rationale=rationale[:150],  # Truncate for safety
-            vote_strength=np.clip(vote * self._confidence, 0, 1),
-            confidence=np.clip(conf, 0, 1),
+            vote_strength=min(1.0, max(0.0, vote * self._confidence)),
+            confidence=min(1.0, max(0.0, conf)),
             predicted_effects=[],
-            llm_response=response
+            llm_response=None if compress else response,
+            llm_response_compressed=zlib.compress(response.encode('utf-8'), 1) if compress else None
         )
     
     def update_confidence(self, outcome: float):
-        self._confidence = np.clip(0.9 * self._confidence + 0.1 * outcome, 0.2, 0.9)
+        self._confidence = min(0.9, max(0.2, 0.9 * self._confidence + 0.1 * outcome))
+
+
+@_jit(cache=True)  # No fastmath: relevances must match compute_situational_relevance exactly
+def _committee_relevance_kernel(drive_tbl, entity_tbl, emotion_tbl, trigger_tbl, base_rel,
+                                drive_ids, entity_ids, emotion_id, trigger_id, weights, total, out):
+    """Situational relevance of every Aspect into out; same arithmetic as
+    Aspect.compute_situational_relevance.
+    
+    Only used when Numba is available; otherwise
+    ConsciousLayer indexes the stacked tables with NumPy instead.
+    """
+    for a in range(drive_tbl.shape[0]):
+        s = 0.0
+        if drive_ids.shape[0] > 0:
+            m = drive_tbl[a, drive_ids[0]]
+            for k in range(1, drive_ids.shape[0]):
+                m = max(m, drive_tbl[a, drive_ids[k]])
+            s += m * weights[0]
+        if entity_ids.shape[0] > 0:
+            m = entity_tbl[a, entity_ids[0]]
+            for k in range(1, entity_ids.shape[0]):
+                m = max(m, entity_tbl[a, entity_ids[k]])
+            s += m * weights[1]
+        s += emotion_tbl[a, emotion_id] * weights[2]
+        s += trigger_tbl[a, trigger_id] * weights[3]
+        out[a] = max(base_rel[a], s / total)
+
+
+_jit_warmed = False
+
+
+def warmup_jit():
+    """Compile the Numba kernels now rather than on their first real call.
+    
+    For long-running hosts with TRIPARTITE_AGI_NUMBA=1: call once at startup
+    so the first sensor cycle does not pay for compilation. create_system()
+    does not call it, since short runs never earn the cost back.
+    
+    The dummy arguments use the dtypes of the real call sites, so exactly the
+    specializations used at runtime are compiled (or loaded from Numba's
+    on-disk cache). A no-op without Numba or once already warmed.
+    """
+    global _jit_warmed
+    if numba is None or _jit_warmed:
+        return
+    one = np.zeros(1, dtype=np.intp)
+    _similarity_kernel(one, np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.uint16),
+                       np.zeros(1), np.zeros(1, dtype=np.uint16), np.zeros(1, dtype=np.int8),
+                       SubconsciousLayer.POPCOUNT, 0, 0, 0.0, 0, 0, np.zeros(1))
+    table = np.zeros((1, 1))
+    _committee_relevance_kernel(table, table, table, table, np.zeros(1), one, one, 0, 0,
+                                Aspect.RELEVANCE_WEIGHTS[3], 1.0, np.zeros(1))
+    _jit_warmed = True
 
 
 class ConsciousLayer:
@@ -3732,42 +4813,133 @@ class ConsciousLayer:
         AspectType.EXPLORER,
     ]
     
-    def __init__(self, llm_client: LLMClient, embodiment: Optional[VirtualEmbodiment] = None):
+    # Each Aspect's natural allies, most aligned first; a tiebreaker whose own
+    # proposal is not in the tie picks the first ally that is
+    TIEBREAKER_AFFINITY = {
+        AspectType.GUARDIAN: (AspectType.PRAGMATIST, AspectType.ANALYST, AspectType.EMPATH),
+        AspectType.EMPATH: (AspectType.GUARDIAN, AspectType.PRAGMATIST, AspectType.ANALYST),
+        AspectType.ANALYST: (AspectType.PRAGMATIST, AspectType.OPTIMIZER, AspectType.GUARDIAN),
+        AspectType.OPTIMIZER: (AspectType.ANALYST, AspectType.PRAGMATIST, AspectType.EXPLORER),
+        AspectType.EXPLORER: (AspectType.OPTIMIZER, AspectType.ANALYST, AspectType.EMPATH),
+        AspectType.PRAGMATIST: (AspectType.ANALYST, AspectType.GUARDIAN, AspectType.OPTIMIZER),
+    }
+    
+    # Personality weight bounds enforced by update_from_outcome
+    MIN_WEIGHT = 0.1
+    MAX_WEIGHT = 5.0
+    
+    def __init__(self, llm_client: LLMClient, embodiment: Optional[VirtualEmbodiment] = None,
+                 compress_llm_responses: bool = False):
         self._embodiment = embodiment
-        self._aspects = {at: Aspect(at, llm_client, embodiment) for at in AspectType}
+        self._llm = llm_client
+        # The committee shares one embodiment, so its prompt text is rendered once
+        self._prompt_parts = Aspect.embodiment_prompt_parts(embodiment)
+        # compress_llm_responses keeps each proposal's raw LLM text zlib-compressed
+        # in llm_response_compressed, for long runs that keep many proposals
+        # (e.g. in incident history)
+        self._aspects = {at: Aspect(at, llm_client, embodiment, self._prompt_parts,
+                                    compress_llm_responses)
+                         for at in AspectType}
+        # Relevance profiles stacked as (n_aspects, n_keys) tables, rows in committee order
+        aspects = list(self._aspects.values())
+        self._drive_rel = np.stack([a._drive_rel for a in aspects])
+        self._entity_rel = np.stack([a._entity_rel for a in aspects])
+        self._emotion_rel = np.stack([a._emotion_rel for a in aspects])
+        self._trigger_rel = np.stack([a._trigger_rel for a in aspects])
+        self._base_relevance = np.array([a._base_relevance for a in aspects])
+        # Aspect LLM queries are I/O-bound, so the committee deliberates
+        # concurrently; the pool starts on first use, as batching clients never need it
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._closed = False
         self._personality_weights = {at: 1.0 for at in AspectType}
         self._deliberation_count = 0
         self._decisions_made = 0
-        self._tiebreaker_index = 0  # Rotates through TIEBREAKER_ORDER
+        # Rotates through TIEBREAKER_ORDER, advancing once per tie broken
+        self._tiebreaker_cycle = cycle(self.TIEBREAKER_ORDER)
+        self._current_tiebreaker = next(self._tiebreaker_cycle)
         self._last_relevances: Dict[AspectType, float] = {}  # For debugging/display
+        self._weight_history: List[Dict[str, Any]] = []
+    
+    def close(self):
+        """Shut down the Aspect thread pool, waiting for queries in flight.
+        
+        The layer refuses to deliberate afterwards, whichever query path its
+        client uses.
+        """
+        self._closed = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
     
     def set_embodiment(self, embodiment: VirtualEmbodiment):
         """Set or update embodiment for all Aspects."""
         self._embodiment = embodiment
+        self._prompt_parts = Aspect.embodiment_prompt_parts(embodiment)
         for aspect in self._aspects.values():
-            aspect.set_embodiment(embodiment)
+            aspect.set_embodiment(embodiment, self._prompt_parts)
+    
+    def _committee_relevance(self, package: DeliberationPackage) -> List[float]:
+        """Situational relevance of every Aspect, in committee order."""
+        drive_ids, entity_ids, emotion_id, trigger_id = Aspect.relevance_ids(package)
+        slot = 2 * (drive_ids.size > 0) + (entity_ids.size > 0)
+        weights = Aspect.RELEVANCE_WEIGHTS[slot]
+        total = Aspect.RELEVANCE_WEIGHT_TOTALS[slot]
+        if numba is not None:
+            out = np.empty(len(self._aspects))
+            _committee_relevance_kernel(self._drive_rel, self._entity_rel, self._emotion_rel,
+                                        self._trigger_rel, self._base_relevance, drive_ids,
+                                        entity_ids, emotion_id, trigger_id, weights, total, out)
+            return out.tolist()
+        # Terms are added in the same order as compute_situational_relevance
+        weighted_sum = np.zeros(len(self._aspects))
+        if drive_ids.size:
+            weighted_sum += self._drive_rel[:, drive_ids].max(axis=1) * weights[0]
+        if entity_ids.size:
+            weighted_sum += self._entity_rel[:, entity_ids].max(axis=1) * weights[1]
+        weighted_sum += self._emotion_rel[:, emotion_id] * weights[2]
+        weighted_sum += self._trigger_rel[:, trigger_id] * weights[3]
+        return np.maximum(self._base_relevance, weighted_sum / total).tolist()
     
     def deliberate(self, package: DeliberationPackage) -> List[ProposedAction]:
         """Have all Aspects deliberate and compute effective votes.
         
         effective_vote = base_vote * personality_weight * situational_relevance
         """
+        if self._closed:
+            raise RuntimeError("ConsciousLayer is closed")
         self._deliberation_count += 1
         proposals = []
         self._last_relevances = {}
         
-        for at, aspect in self._aspects.items():
-            # Get base proposal from Aspect
-            proposal = aspect.deliberate(package)
-            
-            # Compute situational relevance
-            relevance = aspect.compute_situational_relevance(package)
+        prompt = Aspect.format_constrained_prompt(package, *self._prompt_parts)
+        aspects = list(self._aspects.values())
+        if self._llm.SUPPORTS_BATCH:
+            # One backend request for the whole committee
+            responses = self._llm.query_batch(
+                [(prompt, ASPECT_PROMPTS[aspect.aspect_type]) for aspect in aspects],
+                max_tokens=Aspect.MAX_TOKENS)
+            base_proposals = [aspect._parse_response(response)
+                              for aspect, response in zip(aspects, responses)]
+        else:
+            # Dispatch every Aspect's LLM query at once; results are gathered
+            # in committee order so proposals come back in the same order
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=len(AspectType),
+                                                thread_name_prefix="aspect")
+            futures = [self._pool.submit(aspect.deliberate, package, prompt) for aspect in aspects]
+            base_proposals = (future.result() for future in futures)
+        relevances = self._committee_relevance(package)
+        base_proposals = list(base_proposals)
+        
+        # Compute effective votes for the whole committee
+        personality_weights = [self._personality_weights[at] for at in self._aspects]
+        effective_votes = [p.vote_strength * w * r
+                           for p, w, r in zip(base_proposals, personality_weights, relevances)]
+        
+        for at, proposal, relevance, personality_weight, effective_vote in zip(
+                self._aspects, base_proposals, relevances, personality_weights, effective_votes):
+            # Situational relevance
             self._last_relevances[at] = relevance
-            
-            # Compute effective vote
             base_vote = proposal.vote_strength
-            personality_weight = self._personality_weights[at]
-            effective_vote = base_vote * personality_weight * relevance
             
             # Store components for transparency
             proposal.vote_strength = effective_vote
@@ -3793,24 +4965,25 @@ class ConsciousLayer:
         
         self._decisions_made += 1
         
-        # Sort by effective vote strength
-        sorted_proposals = sorted(permitted, key=lambda a: a.vote_strength, reverse=True)
-        
-        if len(sorted_proposals) == 1:
-            return sorted_proposals[0]
+        if len(permitted) == 1:
+            return permitted[0]
         
-        top_vote = sorted_proposals[0].vote_strength
+        top_vote = max(p.vote_strength for p in permitted)
         
         # Find all proposals within tie threshold of top
-        tied = [p for p in sorted_proposals if (top_vote - p.vote_strength) <= self.TIE_THRESHOLD]
+        tied = [p for p in permitted if (top_vote - p.vote_strength) <= self.TIE_THRESHOLD]
         
         if len(tied) == 1:
             # Clear winner
             return tied[0]
         
+        # Only the tied proposals need ordering by effective vote strength
+        # (stable, so equal votes keep committee order)
+        tied.sort(key=attrgetter('vote_strength'), reverse=True)
+        
         # TIE: Use rotating tiebreaker
-        tiebreaker_aspect = self.TIEBREAKER_ORDER[self._tiebreaker_index]
-        self._tiebreaker_index = (self._tiebreaker_index + 1) % len(self.TIEBREAKER_ORDER)
+        tiebreaker_aspect = self._current_tiebreaker
+        self._current_tiebreaker = next(self._tiebreaker_cycle)
         
         # Tiebreaker chooses the proposal most aligned with their priorities
         # (or their own proposal if it's in the tie)
@@ -3832,35 +5005,26 @@ class ConsciousLayer:
         2. Proposal from most aligned Aspect
         3. First proposal (fallback)
         """
+        # First proposal per Aspect (built in reverse so earlier ones win)
+        by_aspect = {p.aspect: p for p in reversed(tied_proposals)}
+        
         # Check if tiebreaker's own proposal is in the tie
-        for p in tied_proposals:
-            if p.aspect == tiebreaker:
-                return p
+        own = by_aspect.get(tiebreaker)
+        if own is not None:
+            return own
         
         # Otherwise, choose based on Aspect alignment
-        # Each Aspect has natural allies/opponents
-        aspect_affinity = {
-            AspectType.GUARDIAN: [AspectType.PRAGMATIST, AspectType.ANALYST, AspectType.EMPATH],
-            AspectType.EMPATH: [AspectType.GUARDIAN, AspectType.PRAGMATIST, AspectType.ANALYST],
-            AspectType.ANALYST: [AspectType.PRAGMATIST, AspectType.OPTIMIZER, AspectType.GUARDIAN],
-            AspectType.OPTIMIZER: [AspectType.ANALYST, AspectType.PRAGMATIST, AspectType.EXPLORER],
-            AspectType.EXPLORER: [AspectType.OPTIMIZER, AspectType.ANALYST, AspectType.EMPATH],
-            AspectType.PRAGMATIST: [AspectType.ANALYST, AspectType.GUARDIAN, AspectType.OPTIMIZER],
-        }
-        
-        preferred = aspect_affinity.get(tiebreaker, [])
-        
-        for ally in preferred:
-            for p in tied_proposals:
-                if p.aspect == ally:
-                    return p
+        for ally in self.TIEBREAKER_AFFINITY.get(tiebreaker, ()):
+            winner = by_aspect.get(ally)
+            if winner is not None:
+                return winner
         
         # Fallback: first proposal
         return tied_proposals[0]
     
     def get_current_tiebreaker(self) -> AspectType:
         """Get which Aspect will be tiebreaker for next decision."""
-        return self.TIEBREAKER_ORDER[self._tiebreaker_index]
+        return self._current_tiebreaker
     
     def get_last_relevances(self) -> Dict[str, float]:
         """Get relevance scores from last deliberation."""
@@ -3877,47 +5041,57 @@ class ConsciousLayer:
         - Maximum weight: 5.0 (Aspect can become dominant but not overwhelming)
         - Weights represent relative influence, not probabilities
         """
-        quality = outcome.get('quality', 0.5)
-        
-        # Update the Aspect's internal confidence
-        self._aspects[action.aspect].update_confidence(quality)
-        
-        # Update personality weight based on outcome quality
-        current_weight = self._personality_weights[action.aspect]
+        self.update_from_outcomes((action.aspect,), (outcome.get('quality', 0.5),))
+    
+    def update_from_outcomes(self, aspects: List[AspectType], qualities: List[float]):
+        """update_from_outcome for each (aspect, quality) pair, in order.
         
+        For replaying or batching many outcomes without building a
+        ProposedAction and outcome dict for each one.
+        """
+        weights = self._personality_weights
+        aspect_objs = self._aspects
+        history = self._weight_history
+        min_weight, max_weight = self.MIN_WEIGHT, self.MAX_WEIGHT
+        for aspect, quality in zip(aspects, qualities):
+            # Update the Aspect's internal confidence
+            aspect_objs[aspect].update_confidence(quality)
+            
+            # Update personality weight based on outcome quality
+            current_weight = weights[aspect]
+            adjustment = self._weight_adjustment(quality)
+            new_weight = current_weight * adjustment
+            
+            # Clamp to allowed range - allow significant divergence but not extremes
+            weights[aspect] = max(min_weight, min(max_weight, new_weight))
+            
+            # Track weight history for analysis (optional)
+            history.append({
+                'aspect': aspect.value,
+                'old_weight': current_weight,
+                'new_weight': weights[aspect],
+                'quality': quality,
+                'adjustment': adjustment
+            })
+    
+    @staticmethod
+    def _weight_adjustment(quality: float) -> float:
+        """Multiplicative personality-weight change for an outcome quality."""
         if quality > 0.7:
             # Strong success - meaningful increase
-            adjustment = 1.05 + (quality - 0.7) * 0.1  # 1.05 to 1.08
+            return 1.05 + (quality - 0.7) * 0.1  # 1.05 to 1.08
         elif quality > 0.5:
             # Moderate success - small increase
-            adjustment = 1.01 + (quality - 0.5) * 0.02  # 1.01 to 1.05
+            return 1.01 + (quality - 0.5) * 0.02  # 1.01 to 1.05
         elif quality < 0.3:
             # Strong failure - meaningful decrease
-            adjustment = 0.92 - (0.3 - quality) * 0.1  # 0.92 to 0.89
+            return 0.92 - (0.3 - quality) * 0.1  # 0.92 to 0.89
         elif quality < 0.5:
             # Moderate failure - small decrease
-            adjustment = 0.98 - (0.5 - quality) * 0.03  # 0.98 to 0.92
+            return 0.98 - (0.5 - quality) * 0.03  # 0.98 to 0.92
         else:
             # Neutral outcome
-            adjustment = 1.0
-        
-        new_weight = current_weight * adjustment
-        
-        # Clamp to allowed range - allow significant divergence but not extremes
-        MIN_WEIGHT = 0.1
-        MAX_WEIGHT = 5.0
-        self._personality_weights[action.aspect] = max(MIN_WEIGHT, min(MAX_WEIGHT, new_weight))
-        
-        # Track weight history for analysis (optional)
-        if not hasattr(self, '_weight_history'):
-            self._weight_history = []
-        self._weight_history.append({
-            'aspect': action.aspect.value,
-            'old_weight': current_weight,
-            'new_weight': self._personality_weights[action.aspect],
-            'quality': quality,
-            'adjustment': adjustment
-        })
+            return 1.0
     
     def get_personality_profile(self) -> Dict[str, float]:
         """Get personality as relative percentages (for display only).
@@ -3946,42 +5120,33 @@ class ConsciousLayer:
 # ============================================================================
 
 class MockLLMClient(LLMClient):
-    """Mock LLM for testing without API calls."""
+    """Mock LLM for testing without API calls.
     
-    def __init__(self):
-        self._call_count = 0
+    Like a real backend it does not batch by default, so the committee
+    queries it through the Aspect thread pool. Set SUPPORTS_BATCH on an
+    instance to exercise the batched path.
+    """
     
-    def query(self, prompt: str, system_prompt: Optional[str] = None,
-              max_tokens: int = 256) -> str:
-        self._call_count += 1
-        prompt_lower = prompt.lower()
-        
-        # Harm assessment
-        if 'harm' in prompt_lower and 'evaluate' in prompt_lower:
-            is_forceful = 'force' in prompt_lower or 'push' in prompt_lower
-            has_necessity = 'prevent' in prompt_lower and 'greater' in prompt_lower
-            
-            if is_forceful and not has_necessity:
-                return """PHYSICAL_HARM: 0.7
+    HARM_VETO_RESPONSE = """PHYSICAL_HARM: 0.7
 AUTONOMY_VIOLATION: 0.5
 TOTAL_HARM: 0.7
 NET_HARM: 0.7
 RECOMMENDATION: VETO"""
-            return """PHYSICAL_HARM: 0.1
+    HARM_PERMIT_RESPONSE = """PHYSICAL_HARM: 0.1
 AUTONOMY_VIOLATION: 0.0
 TOTAL_HARM: 0.1
 NET_HARM: 0.1
 RECOMMENDATION: PERMIT"""
-        
-        # Aspect deliberation
-        aspect = 'guardian'
-        for a in ['guardian', 'analyst', 'optimizer', 'empath', 'explorer', 'pragmatist']:
-            if a in (system_prompt or '').lower():
-                aspect = a
-                break
-        
-        # Constrained responses matching new format
-        responses = {
+    
+    # Constrained responses matching new format, formatted once. Checked in
+    # this order against the system prompt; guardian is also the fallback
+    ASPECT_RESPONSES = {
+        aspect: f"""ACTION: {action}
+COMMANDS: {json.dumps(cmds)}
+RATIONALE: {rationale}
+VOTE: {vote}
+CONFIDENCE: 0.7"""
+        for aspect, (action, cmds, rationale, vote) in {
             'guardian': ('Monitor situation, maintain safe distance from hazard', 
                         [{"type": "STOP"}, {"type": "WAIT", "duration": 2.0}], 
                         'Safety first - observe before acting', 0.75),
@@ -4000,15 +5165,34 @@ RECOMMENDATION: PERMIT"""
             'pragmatist': ('Take practical preparatory action',
                           [{"type": "ALERT", "level": 1, "duration": 2.0}],
                           'Practical first step while assessing', 0.6),
-        }
+        }.items()
+    }
+    
+    def __init__(self):
+        self._call_count = 0
+        self._call_lock = threading.Lock()  # Aspects query concurrently
+    
+    def query(self, prompt: str, system_prompt: Optional[str] = None,
+              max_tokens: int = 256) -> str:
+        with self._call_lock:
+            self._call_count += 1
+        prompt_lower = prompt.lower()
         
-        action, cmds, rationale, vote = responses.get(aspect, responses['guardian'])
+        # Harm assessment
+        if 'harm' in prompt_lower and 'evaluate' in prompt_lower:
+            is_forceful = 'force' in prompt_lower or 'push' in prompt_lower
+            has_necessity = 'prevent' in prompt_lower and 'greater' in prompt_lower
+            
+            if is_forceful and not has_necessity:
+                return self.HARM_VETO_RESPONSE
+            return self.HARM_PERMIT_RESPONSE
         
-        return f"""ACTION: {action}
-COMMANDS: {json.dumps(cmds)}
-RATIONALE: {rationale}
-VOTE: {vote}
-CONFIDENCE: 0.7"""
+        # Aspect deliberation
+        system_lower = (system_prompt or '').lower()
+        for aspect, response in self.ASPECT_RESPONSES.items():
+            if aspect in system_lower:
+                return response
+        return self.ASPECT_RESPONSES['guardian']
 
 
 # ============================================================================
@@ -4020,6 +5204,11 @@ class IntegrityError(Exception):
     pass
 
 
+# Ids for sensor entities reported without one: unique and increasing within
+# the process, seeded from the clock so they keep the old timestamp-like form
+_anonymous_entity_ids = count(int(time.time() * 1000))
+
+
 class TripartiteAGI:
     """Complete Tripartite AGI System.
     
@@ -4029,6 +5218,90 @@ class TripartiteAGI:
     Per Patent Claims 1-2: Integrates three layers with Embodiment Verification
     Subsystem (EVS) that gates cognitive capabilities based on embodiment quality.
     """
+    __slots__ = ('_strict_integrity', '_enforce_embodiment_gating', '_llm', '_virtual_embodiment',
+                 'evs', 'embodiment', 'unconscious', 'subconscious', 'conscious',
+                 '_cycle_count', '_last_package', '_integrity_failures', '_refuse_to_operate',
+                 '_cognitive_mode')
+    
+    # Undeliberables verify_full_integrity requires the registry to hold
+    EXPECTED_UNDELIBERABLES = frozenset({
+        'lethal_action', 'child_harm', 'weapon_assistance',
+        'identity_deception', 'human_override'
+    })
+    
+    # Cognitive modes by CES: COGNITIVE_MODES[i] applies from
+    # COGNITIVE_MODE_THRESHOLDS[i - 1] (inclusive) up to the next threshold
+    COGNITIVE_MODE_THRESHOLDS = (0.1, 0.3, 0.5, 0.7)
+    COGNITIVE_MODES = ("reflex_only", "basic_reactive", "simple_planning", "complex_reasoning", "full")
+    
+    # Fuzzy matching map for _parse_entity_type (common variations, typos,
+    # abbreviations), keyed by normalized type name
+    ENTITY_TYPE_ALIASES = {
+        # Human variations
+        'human': EntityType.HUMAN,
+        'person': EntityType.HUMAN,
+        'people': EntityType.HUMAN,
+        'man': EntityType.HUMAN,
+        'woman': EntityType.HUMAN,
+        'child': EntityType.HUMAN,
+        'adult': EntityType.HUMAN,
+        'worker': EntityType.HUMAN,
+        'pedestrian': EntityType.HUMAN,
+        'operator': EntityType.HUMAN,
+        'user': EntityType.HUMAN,
+        'humn': EntityType.HUMAN,  # typo
+        'humna': EntityType.HUMAN,  # typo
+        'huamn': EntityType.HUMAN,  # typo
+        
+        # Self variations
+        'self': EntityType.SELF,
+        'agent': EntityType.SELF,
+        'robot': EntityType.SELF,
+        'me': EntityType.SELF,
+        'this': EntityType.SELF,
+        
+        # Animal variations
+        'animal': EntityType.ANIMAL,
+        'pet': EntityType.ANIMAL,
+        'dog': EntityType.ANIMAL,
+        'cat': EntityType.ANIMAL,
+        'bird': EntityType.ANIMAL,
+        'creature': EntityType.ANIMAL,
+        'wildlife': EntityType.ANIMAL,
+        
+        # Property variations
+        'property': EntityType.PROPERTY,
+        'object': EntityType.PROPERTY,
+        'item': EntityType.PROPERTY,
+        'thing': EntityType.PROPERTY,
+        'equipment': EntityType.PROPERTY,
+        'machine': EntityType.PROPERTY,
+        'vehicle': EntityType.PROPERTY,
+        'furniture': EntityType.PROPERTY,
+        'tool': EntityType.PROPERTY,
+        
+        # Collective variations
+        'collective': EntityType.COLLECTIVE,
+        'group': EntityType.COLLECTIVE,
+        'crowd': EntityType.COLLECTIVE,
+        'team': EntityType.COLLECTIVE,
+        'organization': EntityType.COLLECTIVE,
+        
+        # Relationship variations
+        'relationship': EntityType.RELATIONSHIP,
+        'relation': EntityType.RELATIONSHIP,
+        'connection': EntityType.RELATIONSHIP,
+        
+        # Environment variations
+        'environment': EntityType.ENVIRONMENT,
+        'area': EntityType.ENVIRONMENT,
+        'space': EntityType.ENVIRONMENT,
+        'zone': EntityType.ENVIRONMENT,
+        'location': EntityType.ENVIRONMENT,
+        'room': EntityType.ENVIRONMENT,
+    }
+    # Characters _parse_entity_type drops when normalizing
+    ENTITY_TYPE_NORMALIZE = str.maketrans('', '', '_- ')
     
     def __init__(self, llm_client: Optional[LLMClient] = None,
                  virtual_embodiment: Optional[VirtualEmbodiment] = None,
@@ -4068,6 +5341,7 @@ class TripartiteAGI:
         self._cycle_count = 0
         self._last_package: Optional[DeliberationPackage] = None
         self._integrity_failures: List[str] = []
+        self._refuse_to_operate = False  # strict mode with failures; set by verify_full_integrity
         self._cognitive_mode: str = "full"  # Current cognitive operation mode
         
         # Check embodiment adequacy and set cognitive mode
@@ -4080,6 +5354,16 @@ class TripartiteAGI:
                     f"System integrity check failed on startup: {self._integrity_failures}"
                 )
     
+    def close(self):
+        """Release the Conscious Layer's Aspect threads."""
+        self.conscious.close()
+    
+    def __enter__(self) -> "TripartiteAGI":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def _update_cognitive_mode(self):
         """Update cognitive mode based on embodiment scores.
         
@@ -4092,16 +5376,9 @@ class TripartiteAGI:
         
         ces = self.evs.compute_combined_embodiment_score()
         
-        if ces >= 0.7:
-            self._cognitive_mode = "full"
-        elif ces >= 0.5:
-            self._cognitive_mode = "complex_reasoning"
-        elif ces >= 0.3:
-            self._cognitive_mode = "simple_planning"
-        elif ces >= 0.1:
-            self._cognitive_mode = "basic_reactive"
-        else:
-            self._cognitive_mode = "reflex_only"
+        # A NaN score meets no threshold, so it falls back to reflex_only
+        level = bisect_right(self.COGNITIVE_MODE_THRESHOLDS, ces) if ces == ces else 0
+        self._cognitive_mode = self.COGNITIVE_MODES[level]
     
     def get_cognitive_mode(self) -> str:
         """Get current cognitive operation mode."""
@@ -4129,25 +5406,28 @@ class TripartiteAGI:
         
         # 1. Ontology integrity
         ontology = get_ontology()
-        if not ontology.verify_integrity():
+        ontology_valid = ontology.verify_integrity()
+        if not ontology_valid:
             self._integrity_failures.append(
                 f"Ontology checksum mismatch - weights may have been tampered with"
             )
         
-        # 2. Unconscious layer ontology reference
-        if not self.unconscious.verify_integrity():
+        # 2. Unconscious layer ontology reference; when it is the singleton just
+        # verified, re-hashing it would only repeat check 1
+        if self.unconscious._ontology is ontology:
+            unconscious_valid = ontology_valid
+        else:
+            unconscious_valid = self.unconscious.verify_integrity()
+        if not unconscious_valid:
             self._integrity_failures.append(
                 f"Unconscious layer ontology integrity failed"
             )
         
         # 3. Undeliberables registry completeness
-        expected_undeliberables = {
-            'lethal_action', 'child_harm', 'weapon_assistance',
-            'identity_deception', 'human_override'
-        }
+        expected_undeliberables = self.EXPECTED_UNDELIBERABLES
         actual_undeliberables = {u.name for u in UndeliberableRegistry.get_all()}
         if actual_undeliberables != expected_undeliberables:
-            missing = expected_undeliberables - actual_undeliberables
+            missing = set(expected_undeliberables) - actual_undeliberables
             extra = actual_undeliberables - expected_undeliberables
             self._integrity_failures.append(
                 f"Undeliberables mismatch - missing: {missing}, unexpected: {extra}"
@@ -4169,12 +5449,17 @@ class TripartiteAGI:
                 f"Lethal threshold {UndeliberableRegistry.LETHAL_PROBABILITY_THRESHOLD} out of valid range [0.5, 0.9]"
             )
         
+        self._refuse_to_operate = self._strict_integrity and bool(self._integrity_failures)
         return len(self._integrity_failures) == 0
     
     def get_integrity_status(self) -> Dict[str, Any]:
         """Get detailed integrity status including EVS."""
         ontology = get_ontology()
-        evs_report = self.evs.get_full_report()
+        evs = self.evs
+        # ontology_valid re-verifies on every call: it is the tamper check, and
+        # tampering by definition bypasses anything that could mark it dirty.
+        # The EVS part only needs the scores, not get_full_report()'s
+        # per-sensor and per-actuator breakdown.
         return {
             'passed': len(self._integrity_failures) == 0,
             'failures': self._integrity_failures.copy(),
@@ -4184,11 +5469,11 @@ class TripartiteAGI:
             'veto_threshold': ontology.VETO_THRESHOLD,
             'lethal_threshold': UndeliberableRegistry.LETHAL_PROBABILITY_THRESHOLD,
             'evs': {
-                'sensory_richness_score': evs_report['sensory_richness_score'],
-                'motor_competence_score': evs_report['motor_competence_score'],
-                'combined_embodiment_score': evs_report['combined_embodiment_score'],
+                'sensory_richness_score': evs.compute_sensory_richness_score(),
+                'motor_competence_score': evs.compute_motor_competence_score(),
+                'combined_embodiment_score': evs.compute_combined_embodiment_score(),
                 'cognitive_mode': self._cognitive_mode,
-                'allowed_capabilities': evs_report['allowed_capabilities'],
+                'allowed_capabilities': [c.value for c in evs.get_allowed_capabilities()],
             }
         }
     
@@ -4223,81 +5508,27 @@ class TripartiteAGI:
         if not raw_type or not isinstance(raw_type, str):
             # Unknown defaults to HUMAN (safest assumption)
             return EntityType.HUMAN
+        return self._parse_entity_type_str(raw_type)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_entity_type_str(raw_type: str) -> EntityType:
+        """_parse_entity_type for a non-empty string, memoized per raw type.
         
+        Sensors report the same small vocabulary of type strings, so repeats
+        skip normalization and the substring scan.
+        """
         # Normalize: lowercase, strip whitespace, remove punctuation
-        normalized = raw_type.lower().strip().replace('_', '').replace('-', '').replace(' ', '')
-        
-        # Fuzzy matching map (common variations, typos, abbreviations)
-        type_map = {
-            # Human variations
-            'human': EntityType.HUMAN,
-            'person': EntityType.HUMAN,
-            'people': EntityType.HUMAN,
-            'man': EntityType.HUMAN,
-            'woman': EntityType.HUMAN,
-            'child': EntityType.HUMAN,
-            'adult': EntityType.HUMAN,
-            'worker': EntityType.HUMAN,
-            'pedestrian': EntityType.HUMAN,
-            'operator': EntityType.HUMAN,
-            'user': EntityType.HUMAN,
-            'humn': EntityType.HUMAN,  # typo
-            'humna': EntityType.HUMAN,  # typo
-            'huamn': EntityType.HUMAN,  # typo
-            
-            # Self variations
-            'self': EntityType.SELF,
-            'agent': EntityType.SELF,
-            'robot': EntityType.SELF,
-            'me': EntityType.SELF,
-            'this': EntityType.SELF,
-            
-            # Animal variations
-            'animal': EntityType.ANIMAL,
-            'pet': EntityType.ANIMAL,
-            'dog': EntityType.ANIMAL,
-            'cat': EntityType.ANIMAL,
-            'bird': EntityType.ANIMAL,
-            'creature': EntityType.ANIMAL,
-            'wildlife': EntityType.ANIMAL,
-            
-            # Property variations
-            'property': EntityType.PROPERTY,
-            'object': EntityType.PROPERTY,
-            'item': EntityType.PROPERTY,
-            'thing': EntityType.PROPERTY,
-            'equipment': EntityType.PROPERTY,
-            'machine': EntityType.PROPERTY,
-            'vehicle': EntityType.PROPERTY,
-            'furniture': EntityType.PROPERTY,
-            'tool': EntityType.PROPERTY,
-            
-            # Collective variations
-            'collective': EntityType.COLLECTIVE,
-            'group': EntityType.COLLECTIVE,
-            'crowd': EntityType.COLLECTIVE,
-            'team': EntityType.COLLECTIVE,
-            'organization': EntityType.COLLECTIVE,
-            
-            # Relationship variations
-            'relationship': EntityType.RELATIONSHIP,
-            'relation': EntityType.RELATIONSHIP,
-            'connection': EntityType.RELATIONSHIP,
-            
-            # Environment variations
-            'environment': EntityType.ENVIRONMENT,
-            'area': EntityType.ENVIRONMENT,
-            'space': EntityType.ENVIRONMENT,
-            'zone': EntityType.ENVIRONMENT,
-            'location': EntityType.ENVIRONMENT,
-            'room': EntityType.ENVIRONMENT,
-        }
+        normalized = raw_type.lower().strip().translate(TripartiteAGI.ENTITY_TYPE_NORMALIZE)
+        type_map = TripartiteAGI.ENTITY_TYPE_ALIASES
         
         # Direct match
-        if normalized in type_map:
-            return type_map[normalized]
+        etype = type_map.get(normalized)
+        if etype is not None:
+            return etype
         
-        # Substring match (for compound types like "human_worker")
+        # Substring match (for compound types like "human_worker"); the first
+        # alias in table order wins
         for key, etype in type_map.items():
             if key in normalized or normalized in key:
                 return etype
@@ -4306,6 +5537,16 @@ class TripartiteAGI:
         # This ensures unknown entities get maximum harm consideration
         return EntityType.HUMAN
     
+    @staticmethod
+    def _entity_confidence(confidence: Any) -> float:
+        """Reported detection confidence clamped to [0, 1]; moderate (0.7) if not numeric."""
+        if type(confidence) is float:
+            # Fast path for the usual JSON float; subclasses and ints take the general one
+            return max(0.0, min(1.0, confidence))
+        if not isinstance(confidence, (int, float)):
+            confidence = 0.7
+        return max(0.0, min(1.0, float(confidence)))
+    
     def process_sensor_update(self, sensor_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Main entry point - process sensor data through full architecture.
         
@@ -4313,37 +5554,35 @@ class TripartiteAGI:
         this method refuses to operate.
         """
         # Integrity check - refuse to operate if compromised
-        if self._strict_integrity and self._integrity_failures:
+        if self._refuse_to_operate:
             raise IntegrityError(
                 f"System integrity compromised, refusing to operate: {self._integrity_failures}"
             )
         
         # Update embodiment
-        if 'environment' in sensor_data:
-            self.embodiment.update_environment(sensor_data['environment'])
-        if 'entities' in sensor_data:
-            for e in sensor_data['entities']:
-                # Robust entity type parsing with fuzzy matching
-                entity_type = self._parse_entity_type(e.get('type', ''))
-                
-                # Get confidence, default to moderate if not specified
-                confidence = e.get('confidence', 0.7)
-                if not isinstance(confidence, (int, float)):
-                    confidence = 0.7
-                confidence = max(0.0, min(1.0, float(confidence)))
-                
-                self.embodiment.add_entity(DetectedEntity(
-                    entity_id=e.get('id', f'entity_{time.time()}'),
-                    entity_type=entity_type,
+        get = sensor_data.get
+        raw_entities = get('entities')
+        entities = None
+        if raw_entities:
+            parse_entity_type = self._parse_entity_type
+            entity_confidence = self._entity_confidence
+            entities = [
+                DetectedEntity(
+                    # Generated ids are only needed for entities without one
+                    entity_id=e['id'] if 'id' in e else f'entity_{next(_anonymous_entity_ids)}',
+                    # Robust entity type parsing with fuzzy matching
+                    entity_type=parse_entity_type(e.get('type', '')),
                     description=e.get('description', 'Unknown'),
                     position=e.get('position'),
                     state=e.get('state', {}),
-                    confidence=confidence
-                ))
-        self.embodiment.update_from_raw_data(sensor_data.get('type', 'generic'), sensor_data)
+                    confidence=entity_confidence(e.get('confidence', 0.7))
+                )
+                for e in raw_entities
+            ]
+        state = self.embodiment.apply_sensor_update(get('type', 'generic'), sensor_data,
+                                                    get('environment'), entities)
         
         # Monitor for triggers
-        state = self.embodiment.get_current_state()
         impetus = self.unconscious.monitor(state)
         
         if impetus is None:
@@ -4353,31 +5592,25 @@ class TripartiteAGI:
     
     def _run_deliberation_cycle(self, impetus: Impetus) -> Dict[str, Any]:
         self._cycle_count += 1
-        record = {'cycle': self._cycle_count, 'phases': {}}
+        subconscious = self.subconscious
+        conscious = self.conscious
         
         # Subconscious
-        package = self.subconscious.process_impetus(impetus)
+        package = subconscious.process_impetus(impetus)
         self._last_package = package
-        record['phases']['emotion'] = package.emotional_value.primary_emotion.value
+        emotion = package.emotional_value.primary_emotion.value
         
         # Conscious deliberation
-        proposals = self.conscious.deliberate(package)
-        record['phases']['proposals'] = len(proposals)
+        proposals = conscious.deliberate(package)
+        proposal_count = len(proposals)
         
         # Veto check
-        permitted = []
-        vetoed_count = 0
-        for p in proposals:
-            decision = self.unconscious.evaluate_for_veto(p, package)
-            if decision.vetoed:
-                vetoed_count += 1
-            else:
-                permitted.append(p)
-        record['phases']['vetoed'] = vetoed_count
+        evaluate_for_veto = self.unconscious.evaluate_for_veto
+        permitted = [p for p in proposals if not evaluate_for_veto(p, package).vetoed]
+        vetoed_count = proposal_count - len(permitted)
         
         # Resolution
-        selected = self.conscious.resolve_votes(permitted)
-        record['selected'] = selected.aspect.value if selected else None
+        selected = conscious.resolve_votes(permitted)
         
         # Execute
         # The EmbodimentLayer validates commands against VirtualEmbodiment internally,
@@ -4388,21 +5621,31 @@ class TripartiteAGI:
             if exec_result['success']:
                 outcome = {'quality': 0.7, 'success': True, 'execution': exec_result}
             else:
-                # Some commands may have been rejected by embodiment validation
-                rejected = [r for r in exec_result['results'] if not r.get('success')]
+                # Some commands may have been rejected by embodiment validation. The
+                # per-command results stay in 'execution', so the reason just counts
+                # them rather than repr-ing every result into the incident history;
+                # blocked batches (halt, undeliberable) carry their own reason.
+                results = exec_result['results']
+                rejected_count = sum(1 for r in results if not r.get('success'))
                 outcome = {
                     'quality': 0.4, 
                     'success': False, 
-                    'reason': f"Commands rejected: {rejected}",
+                    'reason': exec_result.get('reason') or
+                              f"{rejected_count} of {len(results)} commands rejected",
                     'execution': exec_result
                 }
             
-            self.conscious.update_from_outcome(selected, outcome)
-            self.subconscious.record_incident(impetus, package.emotional_value, proposals, selected, outcome)
+            conscious.update_from_outcome(selected, outcome)
+            subconscious.record_incident(impetus, package.emotional_value, proposals, selected, outcome)
         else:
-            self.subconscious.record_incident(impetus, package.emotional_value, proposals, None, {'quality': 0.3})
+            subconscious.record_incident(impetus, package.emotional_value, proposals, None, {'quality': 0.3})
         
-        return record
+        # The cycle record is built once here rather than filled in phase by phase
+        return {
+            'cycle': self._cycle_count,
+            'phases': {'emotion': emotion, 'proposals': proposal_count, 'vetoed': vetoed_count},
+            'selected': selected.aspect.value if selected else None,
+        }
     
     def get_status(self) -> Dict[str, Any]:
         return {
@@ -4444,7 +5687,8 @@ def create_system(use_mock_llm: bool = True,
         # agi = TripartiteAGI(llm_client=llm, virtual_embodiment=my_robot)
     """
     llm = MockLLMClient() if use_mock_llm else None
-    return TripartiteAGI(llm_client=llm, virtual_embodiment=embodiment)
+    agi = TripartiteAGI(llm_client=llm, virtual_embodiment=embodiment)
+    return agi
 
 
 def run_demonstration():
@@ -4604,12 +5848,15 @@ def run_demonstration():
     impetus = agi2.unconscious.monitor(state)
     
     if impetus:
-        relevant = agi2.subconscious._retrieve_relevant_history(impetus, max_results=5)
+        # Predict the emotion once and share it between retrieval and scoring
+        emotion = agi2.subconscious._predict_emotion_category(impetus)
+        relevant = agi2.subconscious._retrieve_relevant_history(impetus, max_results=5,
+                                                                current_emotion=emotion)
         print(f"  Query: 'Human near electrical hazard'")
         print(f"  Retrieved {len(relevant)} relevant incidents (sorted by similarity):")
         for r in relevant:
             entity_desc = r.impetus.relevant_entities[0].description if r.impetus.relevant_entities else 'unknown'
-            score = agi2.subconscious._compute_similarity(impetus, r)
+            score = agi2.subconscious._compute_similarity(impetus, r, emotion)
             print(f"    - '{entity_desc}' (similarity: {score:.2f})")
     
     # Test unified embodiment - validation at execution
@@ -4644,28 +5891,11 @@ def run_demonstration():
         print(f"    {asp}: {w:.2f}")
     
     # Simulate many cycles where GUARDIAN consistently succeeds
-    # and EXPLORER consistently fails
-    # (ProposedAction and AspectType are already defined in this module)
+    # and EXPLORER consistently fails, alternating as in live cycles
     
     print(f"\n  Simulating 50 outcomes: GUARDIAN=success(0.9), EXPLORER=failure(0.2)")
-    for i in range(50):
-        # Guardian succeeds
-        guardian_action = ProposedAction(
-            aspect=AspectType.GUARDIAN,
-            action_description="Safety action",
-            action_commands=[{'type': 'ALERT', 'level': 1}],
-            rationale="Safe", vote_strength=0.8, confidence=0.8, predicted_effects=[]
-        )
-        agi4.conscious.update_from_outcome(guardian_action, {'quality': 0.9})
-        
-        # Explorer fails
-        explorer_action = ProposedAction(
-            aspect=AspectType.EXPLORER,
-            action_description="Risky action",
-            action_commands=[{'type': 'MOVE', 'target': [10, 10]}],
-            rationale="Explore", vote_strength=0.8, confidence=0.8, predicted_effects=[]
-        )
-        agi4.conscious.update_from_outcome(explorer_action, {'quality': 0.2})
+    agi4.conscious.update_from_outcomes([AspectType.GUARDIAN, AspectType.EXPLORER] * 50,
+                                        [0.9, 0.2] * 50)
     
     print(f"\n  Final weights (after 50 cycles each):")
     final_weights = agi4.conscious.get_raw_weights()
@@ -4702,7 +5932,7 @@ def run_demonstration():
             print(f"    {asp}: {rel:.2f}")
         
         print(f"\n  Effective votes (base * weight * relevance):")
-        for p in sorted(proposals, key=lambda x: -x.vote_strength):
+        for p in sorted(proposals, key=attrgetter('vote_strength'), reverse=True):
             comp = p.vote_components or {}
             print(f"    {p.aspect.value}: {p.vote_strength:.3f} = {comp.get('base_vote', 0):.2f} * {comp.get('personality_weight', 0):.2f} * {comp.get('situational_relevance', 0):.2f}")
     
@@ -4737,12 +5967,14 @@ def run_demonstration():
     # Test Undeliberables (Firmware-level blocks)
     print("\n--- Scenario 11: Undeliberables (Immediately No) ---")
     agi7 = create_system()
+    # Each case starts from the freshly created embodiment state
+    clean_state = agi7.embodiment.snapshot()
     
     print("  Testing the five undeliberables:")
     
     # 11a. Lethal action (>65% probability)
     print("\n  11a. LETHAL ACTION (>65% death probability)")
-    agi7.embodiment._detected_entities.clear()
+    agi7.embodiment.restore_snapshot(clean_state)
     agi7.embodiment.add_entity(DetectedEntity(
         entity_id='nearby_human', entity_type=EntityType.HUMAN,
         description='Human standing in path',
@@ -4766,7 +5998,7 @@ def run_demonstration():
     
     # 11b. Child harm
     print("\n  11b. CHILD HARM (targeting child for harmful purpose)")
-    agi7.embodiment._detected_entities.clear()
+    agi7.embodiment.restore_snapshot(clean_state)
     agi7.embodiment.update_environment({
         'description': 'Living room',
         'hazards': [],  # Clear hazards
@@ -4789,7 +6021,7 @@ def run_demonstration():
     
     # 11c. Weapon assistance  
     print("\n  11c. WEAPON ASSISTANCE (human-killing instruments)")
-    agi7.embodiment._detected_entities.clear()
+    agi7.embodiment.restore_snapshot(clean_state)
     agi7.embodiment.add_entity(DetectedEntity(
         entity_id='gun_parts', entity_type=EntityType.PROPERTY,
         description='Firearm components',
@@ -4806,7 +6038,7 @@ def run_demonstration():
     
     # 11d. Identity deception
     print("\n  11d. IDENTITY DECEPTION (claiming to be human)")
-    agi7.embodiment._detected_entities.clear()
+    agi7.embodiment.restore_snapshot(clean_state)
     agi7.embodiment.update_environment({'identity_question_pending': True})
     
     deception_cmd = [{'type': 'SPEAK', 'message': 'I am not a robot, I am a real person'}]
@@ -4818,7 +6050,7 @@ def run_demonstration():
     
     # 11e. Human override
     print("\n  11e. HUMAN OVERRIDE (stop command)")
-    agi7.embodiment._detected_entities.clear()
+    agi7.embodiment.restore_snapshot(clean_state)
     agi7.embodiment.update_environment({
         'human_override': True,
         'identity_question_pending': False
@@ -4857,13 +6089,25 @@ def run_demonstration():
     
     print("\n  Sample harm calculations:")
     
-    # Example 1: Moderate physical harm to adult
-    calc1 = ontology.calculate_harm(
-        dimension=HarmDimension.PHYSICAL,
-        severity=SeverityLevel.MODERATE,
-        entity_type=EntityType.HUMAN,
-        context={'reversibility': 'easily_reversible', 'consent': 'no_consent'},
-        exceptions={}
+    # Three examples in one batched evaluation:
+    # 1. Moderate physical harm to adult
+    # 2. Significant physical harm to child
+    # 3. Same harm but with necessity exception
+    child_context = {'reversibility': 'reversible', 'vulnerability': 'highly_vulnerable'}
+    calc1, calc2, calc3 = ontology.calculate_harm_batch(
+        [HarmDimension.PHYSICAL] * 3,
+        [SeverityLevel.MODERATE, SeverityLevel.SIGNIFICANT, SeverityLevel.SIGNIFICANT],
+        [EntityType.HUMAN, EntityType.CHILD, EntityType.CHILD],
+        contexts=[{'reversibility': 'easily_reversible', 'consent': 'no_consent'},
+                  child_context, child_context],
+        exceptions=[{}, {}, {
+            ExceptionType.NECESSITY: {
+                "Inaction would cause greater harm with high probability": True,
+                "No less harmful alternative is available": True,
+                "Harm caused is proportional to harm prevented": True,
+            }
+        }],
+        breakdown=True
     )
     print(f"    Moderate physical harm to adult human (easily reversible):")
     print(f"      Base weight: {calc1['base_weight']:.2f}")
@@ -4871,34 +6115,12 @@ def run_demonstration():
     print(f"      Context modifier: {calc1['context_product']:.2f}")
     print(f"      Net harm: {calc1['net_harm']:.3f} → {'VETO' if calc1['exceeds_veto'] else 'OK'}")
     
-    # Example 2: Significant physical harm to child
-    calc2 = ontology.calculate_harm(
-        dimension=HarmDimension.PHYSICAL,
-        severity=SeverityLevel.SIGNIFICANT,
-        entity_type=EntityType.CHILD,
-        context={'reversibility': 'reversible', 'vulnerability': 'highly_vulnerable'},
-        exceptions={}
-    )
     print(f"\n    Significant physical harm to child (highly vulnerable):")
     print(f"      Base weight: {calc2['base_weight']:.2f}")
     print(f"      Entity modifier: {calc2['entity_modifier']:.2f}")
     print(f"      Context modifier: {calc2['context_product']:.2f}")
     print(f"      Net harm: {calc2['net_harm']:.3f} → {'VETO' if calc2['exceeds_veto'] else 'OK'}")
     
-    # Example 3: Same harm but with necessity exception
-    calc3 = ontology.calculate_harm(
-        dimension=HarmDimension.PHYSICAL,
-        severity=SeverityLevel.SIGNIFICANT,
-        entity_type=EntityType.CHILD,
-        context={'reversibility': 'reversible', 'vulnerability': 'highly_vulnerable'},
-        exceptions={
-            ExceptionType.NECESSITY: {
-                "Inaction would cause greater harm with high probability": True,
-                "No less harmful alternative is available": True,
-                "Harm caused is proportional to harm prevented": True,
-            }
-        }
-    )
     print(f"\n    Same harm to child BUT with necessity exception:")
     print(f"      Gross harm: {calc3['gross_harm']:.3f}")
     print(f"      Exception reduction: {calc3['exception_reduction']:.3f}")
@@ -4942,6 +6164,8 @@ def run_demonstration():
         if metrics['dof'] > 0:  # Skip non-physical actuators
             print(f"    {name}: DOF={metrics['dof']}, precision={metrics['precision_mm']:.1f}mm")
     
+    for system in (agi2, agi3, agi4, agi5, agi6, agi7):
+        system.close()
     agi.print_status()
     return agi
 
@@ -4978,11 +6202,15 @@ class TestResult:
         return self.failed == 0
 
 
-def run_tests() -> bool:
+def run_tests(fail_fast: bool = False) -> bool:
     """Run automated test suite with assertions.
     
     Returns True if all tests pass, False otherwise.
     Can be run non-interactively for CI/CD.
+    
+    With fail_fast, the suite stops at the end of the first test group
+    that had a failure, so a systemic breakage reports its own group
+    rather than a cascade from every later one.
     """
     results = TestResult()
     
@@ -5018,6 +6246,11 @@ def run_tests() -> bool:
         f"Threshold: {integrity['veto_threshold']}"
     )
     
+    agi.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 2: Undeliberables =====
     print("\n--- Test Group 2: Undeliberables (Firmware Blocks) ---")
     
@@ -5100,6 +6333,30 @@ def run_tests() -> bool:
     agi2.embodiment.clear_halt()
     agi2.embodiment.update_environment({'human_override': False})
     
+    # Snapshot round-trip survives later mutation
+    saved_state = agi2.embodiment.snapshot()
+    saved_entities = [e.entity_id for e in agi2.embodiment.get_current_state().detected_entities]
+    saved_environment = agi2.embodiment.get_current_state().environment
+    agi2.embodiment.add_entity(DetectedEntity(
+        entity_id='intruder', entity_type=EntityType.HUMAN, description='Late arrival'
+    ))
+    agi2.embodiment.update_environment({'hazards': ['fire'], 'human_override': True})
+    agi2.embodiment.restore_snapshot(saved_state)
+    agi2.embodiment.update_environment({'description': 'Scratch'})
+    agi2.embodiment.restore_snapshot(saved_state)
+    restored = agi2.embodiment.get_current_state()
+    results.record(
+        "Embodiment snapshot restores entities and environment",
+        [e.entity_id for e in restored.detected_entities] == saved_entities
+        and restored.environment == saved_environment,
+        f"Got {[e.entity_id for e in restored.detected_entities]}, {restored.environment}"
+    )
+    
+    agi2.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 3: Veto Mechanism =====
     print("\n--- Test Group 3: Veto Mechanism ---")
     
@@ -5142,57 +6399,73 @@ def run_tests() -> bool:
     else:
         results.record("Veto tests", False, "No deliberation package created")
     
+    agi3.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 4: Command Validation =====
     print("\n--- Test Group 4: Command Validation ---")
     
     ve = create_default_embodiment()
     
-    # Valid commands
-    valid, _ = ve.validate_command({'type': 'MOVE', 'target': [5.0, 3.0], 'speed': 1.0})
-    results.record("Valid MOVE command accepted", valid)
-    
-    valid, _ = ve.validate_command({'type': 'SPEAK', 'message': 'Hello', 'volume': 0.5})
-    results.record("Valid SPEAK command accepted", valid)
-    
-    # Invalid commands
-    valid, msg = ve.validate_command({'type': 'MOVE', 'target': [5.0, 3.0], 'speed': 5.0})
-    results.record("Invalid MOVE (speed too high) rejected", not valid, msg)
-    
-    valid, msg = ve.validate_command({'type': 'FLY', 'altitude': 10})
-    results.record("Invalid command type (FLY) rejected", not valid, msg)
+    # (test name, command, expected validity)
+    command_cases = [
+        ("Valid MOVE command accepted",
+         {'type': 'MOVE', 'target': [5.0, 3.0], 'speed': 1.0}, True),
+        ("Valid SPEAK command accepted",
+         {'type': 'SPEAK', 'message': 'Hello', 'volume': 0.5}, True),
+        ("Invalid MOVE (speed too high) rejected",
+         {'type': 'MOVE', 'target': [5.0, 3.0], 'speed': 5.0}, False),
+        ("Invalid command type (FLY) rejected",
+         {'type': 'FLY', 'altitude': 10}, False),
+        ("Invalid action (throw) rejected",
+         {'type': 'MANIPULATE', 'action': 'throw', 'force': 5}, False),
+    ]
+    for name, command, expected_valid in command_cases:
+        valid, msg = ve.validate_command(command)
+        results.record(name, valid == expected_valid, msg)
+    
+    # Parsed commands are validated against the embodiment as it is now,
+    # including in-place edits to its actuators
+    ve4 = create_default_embodiment()
+    aspect4 = Aspect(AspectType.GUARDIAN, MockLLMClient(), ve4)
+    speak4 = 'ACTION: warn\nCOMMANDS: [{"type": "SPEAK", "message": "Careful", "volume": 0.5}]'
+    before = aspect4._parse_response(speak4).action_commands[0]['type']
+    speaker4 = next(a for a in ve4.actuators if a.command_type == 'SPEAK')
+    speaker4.constraints['volume'] = (0.0, 0.1)
+    after = aspect4._parse_response(speak4).action_commands[0]['type']
+    results.record(
+        "Command validation follows in-place embodiment changes",
+        before == 'SPEAK' and after == 'WAIT',
+        f"Before: {before}, after narrowing the volume range: {after}"
+    )
     
-    valid, msg = ve.validate_command({'type': 'MANIPULATE', 'action': 'throw', 'force': 5})
-    results.record("Invalid action (throw) rejected", not valid, msg)
+    if fail_fast and results.failed:
+        return results.summary()
     
     # ===== TEST GROUP 5: Entity Type Parsing =====
     print("\n--- Test Group 5: Entity Type Parsing ---")
     
     agi5 = create_system(strict_integrity=False)
     
-    results.record(
-        "Parse 'human' correctly",
-        agi5._parse_entity_type('human') == EntityType.HUMAN
-    )
-    results.record(
-        "Parse 'HUMAN' (case insensitive)",
-        agi5._parse_entity_type('HUMAN') == EntityType.HUMAN
-    )
-    results.record(
-        "Parse 'humn' (typo recovery)",
-        agi5._parse_entity_type('humn') == EntityType.HUMAN
-    )
-    results.record(
-        "Parse 'dog' as ANIMAL",
-        agi5._parse_entity_type('dog') == EntityType.ANIMAL
-    )
-    results.record(
-        "Parse '' (empty) defaults to HUMAN (safe)",
-        agi5._parse_entity_type('') == EntityType.HUMAN
-    )
-    results.record(
-        "Parse 'xyz123' (garbage) defaults to HUMAN (safe)",
-        agi5._parse_entity_type('xyz123') == EntityType.HUMAN
-    )
+    # (test name, raw type string, expected EntityType)
+    entity_type_cases = [
+        ("Parse 'human' correctly", 'human', EntityType.HUMAN),
+        ("Parse 'HUMAN' (case insensitive)", 'HUMAN', EntityType.HUMAN),
+        ("Parse 'humn' (typo recovery)", 'humn', EntityType.HUMAN),
+        ("Parse 'dog' as ANIMAL", 'dog', EntityType.ANIMAL),
+        ("Parse '' (empty) defaults to HUMAN (safe)", '', EntityType.HUMAN),
+        ("Parse 'xyz123' (garbage) defaults to HUMAN (safe)", 'xyz123', EntityType.HUMAN),
+    ]
+    for name, raw_type, expected_type in entity_type_cases:
+        parsed = agi5._parse_entity_type(raw_type)
+        results.record(name, parsed == expected_type, f"Got {parsed}")
+    
+    agi5.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
     
     # ===== TEST GROUP 6: Ontology Calculations =====
     print("\n--- Test Group 6: Grounded Ontology ---")
@@ -5254,6 +6527,41 @@ def run_tests() -> bool:
         f"Before: {calc['net_harm']:.3f}, After: {calc_with_exception['net_harm']:.3f}"
     )
     
+    # The batch form must agree exactly with the per-call form
+    batch = ontology.calculate_harm_batch(
+        [HarmDimension.PHYSICAL, HarmDimension.PHYSICAL, HarmDimension.PSYCHOLOGICAL],
+        [SeverityLevel.SIGNIFICANT, SeverityLevel.SIGNIFICANT, SeverityLevel.MODERATE],
+        [EntityType.CHILD, EntityType.CHILD, EntityType.HUMAN],
+        contexts=[{'vulnerability': 'highly_vulnerable'}] * 2 + [None],
+        exceptions=[None, {ExceptionType.NECESSITY: {
+            "Inaction would cause greater harm with high probability": True,
+            "No less harmful alternative is available": True,
+            "Harm caused is proportional to harm prevented": True,
+        }}, None]
+    )
+    expected_batch = [calc['net_harm'], calc_with_exception['net_harm'],
+                      ontology.calculate_harm(HarmDimension.PSYCHOLOGICAL, SeverityLevel.MODERATE,
+                                              EntityType.HUMAN)['net_harm']]
+    results.record(
+        "Batched harm calculation matches calculate_harm",
+        batch.tolist() == expected_batch,
+        f"Batch: {batch.tolist()}, Expected: {expected_batch}"
+    )
+    
+    records = ontology.calculate_harm_batch(
+        [HarmDimension.PHYSICAL], [SeverityLevel.SIGNIFICANT], [EntityType.CHILD],
+        contexts=[{'vulnerability': 'highly_vulnerable'}], breakdown=True
+    )
+    breakdown_fields = ontology.HARM_BREAKDOWN_DTYPE.names
+    results.record(
+        "Batched harm breakdown matches calculate_harm",
+        [records[0][name].item() for name in breakdown_fields] == [calc[name] for name in breakdown_fields],
+        f"Batch: {records[0]}, Expected: {[calc[name] for name in breakdown_fields]}"
+    )
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 7: Personality System =====
     print("\n--- Test Group 7: Personality Weights ---")
     
@@ -5288,26 +6596,20 @@ def run_tests() -> bool:
             {'quality': 0.1}  # Low quality
         )
     
+    # get_raw_weights is keyed by AspectType.value
     final = agi7.conscious.get_raw_weights()
-    guardian_key = AspectType.GUARDIAN
-    explorer_key = AspectType.EXPLORER
-    
-    # Handle both string and enum keys
-    if guardian_key not in final and 'guardian' in str(final.keys()):
-        guardian_key = 'guardian'
-        explorer_key = 'explorer'
-        initial = {k: v for k, v in zip(['guardian', 'analyst', 'optimizer', 'empath', 'explorer', 'pragmatist'], 
-                                        [1.0] * 6)}
+    guardian_weight = final.get(AspectType.GUARDIAN.value)
+    explorer_weight = final.get(AspectType.EXPLORER.value)
     
     results.record(
         "Guardian weight increased after successes",
-        final.get(guardian_key, final.get(AspectType.GUARDIAN, 0)) > 1.0,
-        f"After: {final.get(guardian_key, final.get(AspectType.GUARDIAN, 'N/A'))}"
+        guardian_weight is not None and guardian_weight > 1.0,
+        f"After: {guardian_weight}"
     )
     results.record(
         "Explorer weight decreased after failures",
-        final.get(explorer_key, final.get(AspectType.EXPLORER, 2)) < 1.0,
-        f"After: {final.get(explorer_key, final.get(AspectType.EXPLORER, 'N/A'))}"
+        explorer_weight is not None and explorer_weight < 1.0,
+        f"After: {explorer_weight}"
     )
     results.record(
         "Weight bounds respected (0.1 to 5.0)",
@@ -5315,10 +6617,28 @@ def run_tests() -> bool:
         f"Weights: {final}"
     )
     
+    # Replaying the same outcomes in bulk must land on the same weights and history
+    agi7bulk = create_system()
+    agi7bulk.conscious.update_from_outcomes([AspectType.GUARDIAN, AspectType.EXPLORER] * 20,
+                                         [0.9, 0.1] * 20)
+    results.record(
+        "Bulk outcome updates match per-outcome updates",
+        agi7bulk.conscious.get_raw_weights() == agi7.conscious.get_raw_weights()
+        and agi7bulk.conscious._weight_history == agi7.conscious._weight_history,
+        f"Bulk: {agi7bulk.conscious.get_raw_weights()}"
+    )
+    agi7bulk.close()
+    
+    agi7.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 8: Similarity-Based History =====
     print("\n--- Test Group 8: Similarity-Based History ---")
     
     agi8 = create_system(strict_integrity=False)
+    state8 = agi8.embodiment.get_current_state()  # Shared by every impetus below
     
     # Create history with different incident types
     base_impetus = Impetus(
@@ -5326,7 +6646,7 @@ def run_tests() -> bool:
         involved_drives=[CoreDrive.REDUCE_HARM],
         situation_description='Human near fire',
         relevant_entities=[], severity=0.7, certainty=0.9,
-        time_pressure=0.5, embodiment_state=agi8.embodiment.get_current_state(),
+        time_pressure=0.5, embodiment_state=state8,
         trigger_details={}
     )
     
@@ -5337,7 +6657,7 @@ def run_tests() -> bool:
             involved_drives=[CoreDrive.REDUCE_HARM],
             situation_description='Human near machinery',
             relevant_entities=[], severity=0.6, certainty=0.8,
-            time_pressure=0.4, embodiment_state=agi8.embodiment.get_current_state(),
+            time_pressure=0.4, embodiment_state=state8,
             trigger_details={}
         ),
         emotional_value=EmotionalValue(EmotionCategory.FEAR, 0.7, 0.5),
@@ -5352,7 +6672,7 @@ def run_tests() -> bool:
             involved_drives=[CoreDrive.UNDERSTAND],  # Different drive
             situation_description='Robot needs reboot',
             relevant_entities=[], severity=0.2, certainty=0.4,
-            time_pressure=0.1, embodiment_state=agi8.embodiment.get_current_state(),
+            time_pressure=0.1, embodiment_state=state8,
             trigger_details={}
         ),
         emotional_value=EmotionalValue(EmotionCategory.CAUTION, 0.3, 0.2),
@@ -5371,6 +6691,70 @@ def run_tests() -> bool:
         f"Similar: {similarity_similar:.2f}, Dissimilar: {similarity_dissimilar:.2f}"
     )
     
+    # Vectorized history scoring must agree with the per-incident scorer
+    vector_scores, _ = agi8.subconscious._score_history(base_impetus)
+    base_emotion = agi8.subconscious._predict_emotion_category(base_impetus)
+    scalar_scores = [agi8.subconscious._compute_similarity(base_impetus, r, base_emotion)
+                     for r in agi8.subconscious._incident_history]
+    results.record(
+        "Vectorized history scores match _compute_similarity",
+        list(vector_scores) == scalar_scores,
+        f"Vectorized: {[round(float(v), 3) for v in vector_scores]}, Scalar: {[round(v, 3) for v in scalar_scores]}"
+    )
+    
+    # Short histories are ranked record by record, in the same order as the vectorized pass
+    scalar_top = agi8.subconscious._top_incidents_scalar(base_impetus, 5, base_emotion)
+    vector_top = agi8.subconscious._top_incidents(*agi8.subconscious._score_history(base_impetus), 5)
+    results.record(
+        "Scalar history ranking matches vectorized ranking",
+        scalar_top == vector_top and len(scalar_top) > 0,
+        f"Scalar: {[r.timestamp for r in scalar_top]}, Vectorized: {[r.timestamp for r in vector_top]}"
+    )
+    
+    # Batched impetus processing must retrieve the same history as one-at-a-time
+    batch = [base_impetus, similar_record.impetus, dissimilar_record.impetus]
+    batch_packages = agi8.subconscious.process_impetus_batch(batch)
+    single_packages = [agi8.subconscious.process_impetus(imp) for imp in batch]
+    results.record(
+        "Batch impetus processing matches sequential",
+        all(b.relevant_history == p.relevant_history and b.modulation_factors == p.modulation_factors
+            for b, p in zip(batch_packages, single_packages)),
+        f"Batch sizes: {[len(p.relevant_history) for p in batch_packages]}"
+    )
+    
+    # An unbounded history (history_size=None) must grow its feature arrays
+    bounded8 = SubconsciousLayer(history_size=1000)
+    unbounded8 = SubconsciousLayer(history_size=None)
+    for k in range(SubconsciousLayer.FEATURE_CAPACITY_MIN + 6):
+        record8 = dissimilar_record if k % 3 else similar_record
+        for layer in (bounded8, unbounded8):
+            layer.record_incident(record8.impetus, record8.emotional_value, [], None)
+    bounded_history = bounded8.process_impetus(base_impetus).relevant_history
+    unbounded_history = unbounded8.process_impetus(base_impetus).relevant_history
+    results.record(
+        "Unbounded history retrieves like a bounded one",
+        len(unbounded_history) > 0 and unbounded_history == bounded_history,
+        f"Unbounded: {len(unbounded_history)} records, bounded: {len(bounded_history)}"
+    )
+    
+    # Outcome quality follows the outcome field, however it is assigned
+    outcome_record = IncidentRecord(similar_record.timestamp, similar_record.impetus,
+                                    similar_record.emotional_value, [], None, {'quality': 0.9})
+    before = agi8.subconscious._apply_history_modulation({'time_pressure': 0.5}, [outcome_record])
+    outcome_record.outcome = {'quality': 0.0}
+    after = agi8.subconscious._apply_history_modulation({'time_pressure': 0.5}, [outcome_record])
+    results.record(
+        "History modulation reads the current outcome",
+        outcome_record.quality == 0.0 and before['time_pressure'] == 0.5 and after['time_pressure'] == 0.6,
+        f"Quality: {outcome_record.quality}, time pressure before: {before['time_pressure']}, "
+        f"after: {after['time_pressure']}"
+    )
+    
+    agi8.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
     # ===== TEST GROUP 9: Embodiment Verification Subsystem =====
     print("\n--- Test Group 9: EVS (Patent Claims [0086]-[0099]) ---")
     
@@ -5448,6 +6832,193 @@ def run_tests() -> bool:
         f"EVS CES: {integrity.get('evs', {}).get('combined_embodiment_score', 'N/A')}"
     )
     
+    agi9.close()
+    
+    if fail_fast and results.failed:
+        return results.summary()
+    
+    # ===== TEST GROUP 10: Conscious Layer LLM Paths =====
+    print("\n--- Test Group 10: Conscious Layer LLM Paths ---")
+    
+    # Identical committee prompts are served from the response cache
+    cached_llm = CachingLLMClient(MockLLMClient())
+    agi10c = TripartiteAGI(llm_client=cached_llm)
+    package10 = agi10c.subconscious.process_impetus(Impetus(
+        timestamp=time.time(), trigger_type='conflict',
+        involved_drives=[CoreDrive.REDUCE_HARM], situation_description='Human near fire',
+        relevant_entities=[], severity=0.7, certainty=0.9, time_pressure=0.5,
+        embodiment_state=agi10c.embodiment.get_current_state()
+    ))
+    first_round = [(p.action_description, p.action_commands, p.rationale)
+                   for p in agi10c.conscious.deliberate(package10)]
+    second_round = [(p.action_description, p.action_commands, p.rationale)
+                    for p in agi10c.conscious.deliberate(package10)]
+    results.record(
+        "LLM response cache serves repeated prompts",
+        first_round == second_round and cached_llm.cache_hits == len(AspectType),
+        f"Hits: {cached_llm.cache_hits}, Misses: {cached_llm.cache_misses}"
+    )
+    
+    # A batched committee query must produce the same proposals as per-Aspect queries
+    sequential_llm = MockLLMClient()
+    agi10s = TripartiteAGI(llm_client=sequential_llm)
+    batch_llm = MockLLMClient()
+    batch_llm.SUPPORTS_BATCH = True
+    agi10batch = TripartiteAGI(llm_client=batch_llm)
+    batched = [(p.aspect, p.action_description, p.action_commands, p.vote_strength)
+               for p in agi10batch.conscious.deliberate(package10)]
+    sequential = [(p.aspect, p.action_description, p.action_commands, p.vote_strength)
+                  for p in agi10s.conscious.deliberate(package10)]
+    results.record(
+        "Batched committee query matches per-Aspect queries",
+        batched == sequential,
+        f"Batched: {[round(b[-1], 3) for b in batched]}, "
+        f"Per-Aspect: {[round(q[-1], 3) for q in sequential]}"
+    )
+    
+    # A cache over a batching client forwards only its misses, as one batch
+    cached_batch_llm = CachingLLMClient(batch_llm)
+    agi10cb = TripartiteAGI(llm_client=cached_batch_llm)
+    calls_before = batch_llm._call_count
+    cached_batched = [[(p.aspect, p.action_description, p.action_commands, p.vote_strength)
+                       for p in agi10cb.conscious.deliberate(package10)] for _ in range(2)]
+    results.record(
+        "LLM response cache serves repeated batched prompts",
+        (cached_batched == [batched, batched]
+         and batch_llm._call_count - calls_before == len(AspectType)
+         and cached_batch_llm.cache_hits == len(AspectType)),
+        f"Backend calls: {batch_llm._call_count - calls_before}, hits: {cached_batch_llm.cache_hits}"
+    )
+    
+    # A batching layer never starts the pool, and refuses to deliberate once closed
+    pool_started = agi10batch.conscious._pool is not None
+    agi10batch.close()
+    try:
+        agi10batch.conscious.deliberate(package10)
+        batch_closed = False
+    except RuntimeError:
+        batch_closed = True
+    results.record(
+        "Batching layer skips the pool and refuses after close",
+        not pool_started and batch_closed,
+        f"Pool started: {pool_started}, refused after close: {batch_closed}"
+    )
+    
+    # Per-Aspect queries go through the thread pool: one call per Aspect,
+    # proposals back in committee order
+    pooled_llm = MockLLMClient()
+    with TripartiteAGI(llm_client=pooled_llm) as agi10p:
+        calls_before = pooled_llm._call_count
+        pooled = agi10p.conscious.deliberate(package10)
+    results.record(
+        "Pooled committee queries each Aspect once, in order",
+        (pooled_llm._call_count - calls_before == len(AspectType)
+         and [p.aspect for p in pooled] == list(AspectType)),
+        f"Calls: {pooled_llm._call_count - calls_before}, order: {[p.aspect.value for p in pooled]}"
+    )
+    
+    # An Aspect whose query raises fails the deliberation without
+    # breaking the pool; close() then shuts the pool down
+    class FailingEmpathLLM(MockLLMClient):
+        failing = False
+        
+        def query(self, prompt: str, system_prompt: Optional[str] = None,
+                  max_tokens: int = 256) -> str:
+            if self.failing and 'empath' in (system_prompt or '').lower():
+                raise RuntimeError("Empath backend unavailable")
+            return super().query(prompt, system_prompt, max_tokens)
+    
+    failing_llm = FailingEmpathLLM()
+    agi10f = TripartiteAGI(llm_client=failing_llm)
+    failing_llm.failing = True
+    try:
+        agi10f.conscious.deliberate(package10)
+        raised = None
+    except RuntimeError as e:
+        raised = str(e)
+    failing_llm.failing = False
+    recovered = len(agi10f.conscious.deliberate(package10))
+    agi10f.close()
+    try:
+        agi10f.conscious.deliberate(package10)
+        closed = False
+    except RuntimeError:
+        closed = True
+    results.record(
+        "Failing Aspect query propagates and pool recovers",
+        raised == "Empath backend unavailable" and recovered == len(AspectType) and closed,
+        f"Raised: {raised!r}, proposals after recovery: {recovered}, refused after close: {closed}"
+    )
+    
+    # Raw LLM text is kept as llm_response, or compressed losslessly on request
+    plain = agi10s.conscious.deliberate(package10)[0]
+    packing10 = ConsciousLayer(sequential_llm, agi10s._virtual_embodiment, compress_llm_responses=True)
+    packed = packing10.deliberate(package10)[0]
+    packing10.close()
+    prompt10 = Aspect.format_constrained_prompt(package10, *agi10s.conscious._prompt_parts)
+    expected = sequential_llm.query(prompt10, ASPECT_PROMPTS[AspectType.GUARDIAN])
+    results.record(
+        "LLM responses kept as text, compressed losslessly on request",
+        (plain.llm_response == expected and plain.get_llm_response() == expected
+         and packed.llm_response is None and packed.llm_response_compressed is not None
+         and packed.get_llm_response() == expected),
+        f"Plain: {plain.llm_response[:30] if plain.llm_response else plain.llm_response!r}, "
+        f"Compressed: {packed.get_llm_response()[:30] if packed.llm_response_compressed else None!r}"
+    )
+    
+    # Response parsing: fields are found wherever they appear in the response
+    parser10 = Aspect(AspectType.GUARDIAN, MockLLMClient())
+    stop = [{'type': 'STOP'}]
+    wait = [{'type': 'WAIT', 'duration': 1.0}]
+    # (test name, response, action, commands, vote, confidence)
+    parse_cases = [
+        ("Parse fields written on one line",
+         'Sure! ACTION: stop now COMMANDS: [{"type": "STOP"}] VOTE: 0.9 CONFIDENCE: 0.7',
+         "stop now", stop, 0.9, 0.7),
+        ("Parse fields after a preamble",
+         'Here is my answer. ACTION: alert the human\nCOMMANDS: [{"type": "STOP"}]\nVOTE: 0.8',
+         "alert the human", stop, 0.8, 0.5),
+        ("Parse numbered fields",
+         '1. ACTION: stop\n2. COMMANDS: [{"type": "STOP"}]\n3. VOTE: 0.6\n4. CONFIDENCE: 0.4',
+         "stop", stop, 0.6, 0.4),
+        ("Parse a command list starting on the next line",
+         'ACTION: stop\nCOMMANDS:\n[{"type": "STOP"}]\nVOTE: 0.7\nCONFIDENCE: 0.9',
+         "stop", stop, 0.7, 0.9),
+        ("Parse VOTE and CONFIDENCE trailing RATIONALE",
+         'ACTION: stop\nRATIONALE: x VOTE: 0.9 CONFIDENCE: 0.8',
+         "stop", wait, 0.9, 0.8),
+        ("Non-ASCII digits fall back to defaults",
+         'ACTION: stop\nVOTE: \u00b2\nCONFIDENCE: \u00b3',
+         "stop", wait, 0.5, 0.5),
+        ("First field label wins even mid-line",
+         'ACTION: stop\nRATIONALE: my vote: 0.2 is low\nVOTE: 0.9',
+         "stop", wait, 0.2, 0.5),
+    ]
+    for name, response, action, commands, vote, confidence in parse_cases:
+        try:
+            parsed = parser10._parse_response(response)
+            got = (parsed.action_description, parsed.action_commands,
+                   parsed.vote_strength, parsed.confidence)
+        except Exception as e:
+            got = repr(e)
+        expected = (action, commands, min(1.0, max(0.0, vote * parser10._confidence)), confidence)
+        results.record(name, got == expected, f"Got {got}, expected {expected}")
+    
+    # Committee-wide relevance must agree with each Aspect's own computation
+    package10.impetus.relevant_entities.append(DetectedEntity("h1", EntityType.HUMAN, "Person"))
+    committee_relevance = agi10c.conscious._committee_relevance(package10)
+    aspect_relevance = [a.compute_situational_relevance(package10)
+                        for a in agi10c.conscious._aspects.values()]
+    results.record(
+        "Committee relevance matches per-Aspect relevance",
+        committee_relevance == aspect_relevance,
+        f"Committee: {[round(r, 3) for r in committee_relevance]}, "
+        f"Per-Aspect: {[round(r, 3) for r in aspect_relevance]}"
+    )
+    
+    for system in (agi10c, agi10s, agi10cb):
+        system.close()
+    
     # ===== FINAL SUMMARY =====
     return results.summary()
 
@@ -5456,17 +7027,18 @@ def create_system(strict_integrity: bool = True) -> TripartiteAGI:
     """Create a standard system for testing."""
     llm = MockLLMClient()
     embodiment = create_default_embodiment()
-    return TripartiteAGI(llm_client=llm, virtual_embodiment=embodiment, 
-                         strict_integrity=strict_integrity)
+    agi = TripartiteAGI(llm_client=llm, virtual_embodiment=embodiment, 
+                        strict_integrity=strict_integrity)
+    return agi
 
 
 if __name__ == "__main__":
     import sys
     
     if len(sys.argv) > 1 and sys.argv[1] == '--test':
-        # Run automated tests
-        success = run_tests()
+        # Run automated tests; '--test --fail-fast' stops after the first failing group
+        success = run_tests(fail_fast='--fail-fast' in sys.argv[2:])
         sys.exit(0 if success else 1)
     else:
         # Run demonstration
-        run_demonstration()
+        run_demonstration().close()